@@ -18,13 +18,74 @@ from tgcsm import (
     print_final_summary,
     Faction
 )
+from tgcsm.config import TURN_DURATION
+
+
+_RULE = "=" * 60
+
+# Static text, built once and written in a single call per replay
+_HEADER = f"""{_RULE}
+T-GCSM v2.0: Human vs AI Battle
+{_RULE}
+"""
+
+_FACTION_MENU = """
+Which faction would you like to command?
+1. PLA (People's Liberation Army) - Invading force
+2. ROC (Republic of China/Taiwan) - Defending force
+"""
+
+_INTRO_HEADER = f"""
+{_RULE}
+GAME INTRODUCTION
+{_RULE}
+"""
+
+_PLA_INTRO = """
+You are commanding the PLA invasion force.
+
+Your objectives:
+- Establish and maintain beachheads on Taiwan's coast
+- Advance inland and capture key objectives
+- Most importantly: Capture Taipei (hex A10) to win
+
+Challenges:
+- Your amphibious lift capacity decreases each turn
+- You must maintain supply lines to your units
+- ROC forces will defend key positions
+"""
+
+_ROC_INTRO = """
+You are commanding the ROC defense forces.
+
+Your objectives:
+- Prevent PLA from capturing Taipei
+- Destroy or attrit PLA invasion forces
+- Hold out for 10 turns (35 days) to win
+
+Advantages:
+- You start with units already deployed
+- Interior lines and defensive terrain
+- PLA must come to you
+"""
+
+_MECHANICS = f"""
+Game mechanics:
+- Each turn represents {TURN_DURATION} days
+- Units can move OR attack each turn
+- Combat uses terrain modifiers and dice rolls
+- Keep units in supply for full effectiveness
+"""
+
+_INTROS = {
+    'PLA': _INTRO_HEADER + _PLA_INTRO + _MECHANICS,
+    'ROC': _INTRO_HEADER + _ROC_INTRO + _MECHANICS,
+}
 
 
 def choose_faction():
     """Let the player choose which faction to command."""
-    print("\nWhich faction would you like to command?")
-    print("1. PLA (People's Liberation Army) - Invading force")
-    print("2. ROC (Republic of China/Taiwan) - Defending force")
+    sys.stdout.write(_FACTION_MENU)
     
     while True:
         choice = input("\nEnter your choice (1 or 2): ").strip()
@@ -38,45 +99,14 @@ def choose_faction():
 
 def print_game_intro(player_faction):
     """Print game introduction and objectives."""
-    print("\n" + "="*60)
-    print("GAME INTRODUCTION")
-    print("="*60)
-    
-    if player_faction == 'PLA':
-        print("\nYou are commanding the PLA invasion force.")
-        print("\nYour objectives:")
-        print("- Establish and maintain beachheads on Taiwan's coast")
-        print("- Advance inland and capture key objectives")
-        print("- Most importantly: Capture Taipei (hex A10) to win")
-        print("\nChallenges:")
-        print("- Your amphibious lift capacity decreases each turn")
-        print("- You must maintain supply lines to your units")
-        print("- ROC forces will defend key positions")
-    else:
-        print("\nYou are commanding the ROC defense forces.")
-        print("\nYour objectives:")
-        print("- Prevent PLA from capturing Taipei")
-        print("- Destroy or attrit PLA invasion forces")
-        print("- Hold out for 10 turns (35 days) to win")
-        print("\nAdvantages:")
-        print("- You start with units already deployed")
-        print("- Interior lines and defensive terrain")
-        print("- PLA must come to you")
-    
-    print("\nGame mechanics:")
-    print("- Each turn represents 3.5 days")
-    print("- Units can move OR attack each turn")
-    print("- Combat uses terrain modifiers and dice rolls")
-    print("- Keep units in supply for full effectiveness")
+    sys.stdout.write(_INTROS['PLA' if player_faction == 'PLA' else 'ROC'])
     
     input("\nPress Enter to start the game...")
 
 
 def run_human_vs_ai():
     """Run a game with human player vs AI."""
-    print("="*60)
-    print("T-GCSM v2.0: Human vs AI Battle")
-    print("="*60)
+    sys.stdout.write(_HEADER)
     
     # Choose faction
     player_faction = choose_faction()
@@ -107,8 +137,8 @@ def run_human_vs_ai():
     print_final_summary(engine)
     
     # Check victory
-    if engine.winner:
-        if engine.winner.value == player_faction:
+    if engine.winner is not None:
+        if engine.winner.name == player_faction:
             print("\n*** CONGRATULATIONS! You have achieved victory! ***")
         else:
             print("\n*** DEFEAT! The AI has won this battle. ***")
@@ -107,7 +107,7 @@ def main():
             export_game_data(engine, args.export)
         
         # Return exit code based on winner
-        if engine.winner:
+        if engine.winner is not None:
             return 0
         else:
             return 1
@@ -0,0 +1,57 @@
+# ==============================================================================
+# T-GCSM v2.0: Taiwan Ground Combat Simulation Model
+# tests/test_agents.py - 에이전트 테스트
+# ==============================================================================
+
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from tgcsm import (load_data, SimulationEngine, ScriptedAgent, HumanAgent,
+                   Faction, Phase, ActionType)
+
+
+class TestHumanAgent(unittest.TestCase):
+
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine = SimulationEngine(load_data(), ScriptedAgent, HumanAgent,
+                                           seed=42)
+        self.engine.current_phase = Phase.PLAYER_ACTION
+
+    def _choose(self, answers):
+        engine = self.engine
+        game_state = engine._get_game_state(Faction.ROC)
+        requested = []
+
+        def possible_actions(kinds):
+            requested.append(tuple(kinds))
+            return engine.iter_possible_actions(Faction.ROC, kinds)
+
+        with mock.patch('builtins.input', side_effect=answers), \
+                contextlib.redirect_stdout(io.StringIO()):
+            chosen = engine.roc_agent.choose_actions(game_state, possible_actions)
+        return chosen, requested
+
+    def test_lazy_action_categories(self):
+        move = ActionType.MOVE.value
+        chosen, requested = self._choose(['1', '0', '1', '0', '5', 'y'])
+        moves = list(self.engine.iter_possible_actions(Faction.ROC, (move,)))
+        self.assertEqual(requested, [(move,), (move,)])
+        # The second pick skips the first unit's moves
+        self.assertEqual(chosen[0], moves[0])
+        self.assertNotEqual(chosen[1]['unit_id'], moves[0]['unit_id'])
+
+    def test_pass_without_actions(self):
+        chosen, requested = self._choose(['5'])
+        self.assertEqual(chosen, [{'action': ActionType.PASS.value}])
+        self.assertEqual(requested, [])
+
+    def test_engine_passes_callable(self):
+        self.assertTrue(HumanAgent.lazy_actions)
+        self.assertFalse(ScriptedAgent.lazy_actions)
+
+
+if __name__ == '__main__':
+    unittest.main()
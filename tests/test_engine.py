@@ -0,0 +1,240 @@
+# ==============================================================================
+# T-GCSM v2.0: Taiwan Ground Combat Simulation Model
+# tests/test_engine.py - 시뮬레이션 엔진 테스트
+# ==============================================================================
+
+import contextlib
+import io
+import unittest
+
+from tgcsm import (load_data, SimulationEngine, ScriptedAgent, Faction,
+                   Phase, SupplyStatus)
+from tgcsm.analysis import generate_turn_summary
+from tgcsm.data_loader import _build_crt_fast
+from tgcsm.engine import (_CRT_COLUMNS, _crt_odds_index, _crt_odds_column,
+                          _format_crt_result)
+
+
+def _quiet(func, *args, **kwargs):
+    """Call func with the engine's progress output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def _land_pla_unit(engine, hex_id):
+    """Land the next PLA reinforcement on hex_id and hand the hex to the PLA."""
+    hex_obj = engine.hexes[hex_id]
+    hex_obj.owner = Faction.PLA
+    unit = engine.pla_reinforcement_pool.pop(0)
+    unit.location_hex_id = hex_id
+    engine.units[unit.unit_id] = unit
+    engine._track_unit(unit)
+    engine._place_unit(unit, hex_obj)
+    return unit
+
+
+class EngineTestCase(unittest.TestCase):
+    """Builds a fresh seeded engine for every test."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data = load_data()
+
+    def setUp(self):
+        self.engine = _quiet(SimulationEngine, self.data, ScriptedAgent,
+                             ScriptedAgent, seed=42)
+
+
+class TestConstruction(EngineTestCase):
+
+    def test_initial_setup(self):
+        engine = self.engine
+        self.assertEqual(len(engine.hexes), 130)
+        self.assertEqual(len(engine.units), 20)
+        self.assertTrue(all(u.faction == Faction.ROC for u in engine.units.values()))
+
+    def test_reinforcement_factions(self):
+        # Brigade names such as "1st Amphibious Brigade" must not be parsed
+        # as a faction
+        pool = self.engine.pla_reinforcement_pool
+        self.assertEqual(len(pool), 12)
+        self.assertEqual(pool[0].unit_id, 'PLA_AMPH_1_BN1')
+        self.assertTrue(all(u.faction is Faction.PLA for u in pool))
+
+    def test_seeded_game(self):
+        engine = self.engine
+        _quiet(engine.run_simulation)
+        self.assertTrue(engine.game_over)
+        self.assertIs(engine.winner, Faction.ROC)
+        self.assertEqual(engine.turn_number, 11)
+
+
+class TestHexGrid(EngineTestCase):
+
+    def test_neighbors(self):
+        engine = self.engine
+        self.assertEqual(engine.hex_neighbors['E5'], ['F5', 'F4', 'E4', 'D4', 'D5', 'E6'])
+        self.assertEqual(engine.hex_neighbors_idx[engine.hex_index['E5']].tolist(),
+                         [69, 68, 55, 42, 43, 57])
+        # Corner hexes have off-map slots
+        self.assertEqual(engine.hex_neighbors['A1'], ['B1', 'A2'])
+        self.assertEqual(engine.hex_neighbors['J13'], ['J12', 'I13'])
+        self.assertEqual(engine.hex_neighbors_idx[engine.hex_index['A1']].tolist().count(-1), 4)
+
+    def test_distances(self):
+        engine = self.engine
+        self.assertEqual(engine.get_hex_distance('E5', 'E5'), 0.0)
+        self.assertEqual(engine.get_hex_distance('A1', 'B1'), 1.0)
+        self.assertEqual(engine.get_hex_distance('A1', 'J13'), 17.0)
+        self.assertEqual(engine.get_hex_distance('A1', 'ZZ'), float('inf'))
+        a1, j13 = engine.hex_index['A1'], engine.hex_index['J13']
+        self.assertEqual(engine.bulk_hex_distance([a1, j13], j13).tolist(), [17, 0])
+
+
+class TestSupplySources(EngineTestCase):
+
+    def test_initial_sources(self):
+        engine = self.engine
+        sources = engine._supply_source_mask(Faction.ROC)
+        self.assertEqual([engine.hex_ids[i] for i in sources.nonzero()[0]],
+                         [f'J{row}' for row in range(1, 14)])
+        self.assertFalse(engine._supply_source_mask(Faction.PLA).any())
+
+    def test_beachhead_sources(self):
+        engine = self.engine
+        _land_pla_unit(engine, 'A1')
+        sources = engine._supply_source_mask(Faction.PLA)
+        self.assertEqual([engine.hex_ids[i] for i in sources.nonzero()[0]], ['A1'])
+        # Coastal hexes only act as PLA sources for the first three turns;
+        # masks are rebuilt at the next supply phase
+        engine.turn_number = 4
+        _quiet(engine._run_supply_phase)
+        self.assertFalse(engine._supply_source_mask(Faction.PLA).any())
+
+
+class TestSupplyStatus(EngineTestCase):
+
+    def test_initial_roc_supply(self):
+        engine = self.engine
+        self.assertTrue(engine._compute_supply_map(Faction.ROC).all())
+        _quiet(engine._run_supply_phase)
+        self.assertTrue(all(u.supply_status is SupplyStatus.In_Supply
+                            for u in engine.units.values()))
+
+    def test_beachhead_supply(self):
+        engine = self.engine
+        unit = _land_pla_unit(engine, 'A1')
+        _quiet(engine._run_supply_phase)
+        self.assertIs(unit.supply_status, SupplyStatus.In_Supply)
+        self.assertEqual(unit.turns_out_of_supply, 0)
+
+    def test_beachhead_expires(self):
+        engine = self.engine
+        unit = _land_pla_unit(engine, 'A1')
+        engine.turn_number = 4
+        _quiet(engine._run_supply_phase)
+        self.assertIs(unit.supply_status, SupplyStatus.Out_Of_Supply)
+        self.assertEqual(unit.turns_out_of_supply, 1)
+
+
+class TestOddsBins(unittest.TestCase):
+
+    def test_column_thresholds(self):
+        cases = [(0.5, '1:2'), (0.74, '1:2'), (0.75, '1:1'), (1.49, '1:1'),
+                 (1.5, '2:1'), (2.5, '3:1'), (3.49, '3:1'), (3.5, '4:1+'),
+                 (10.0, '4:1+')]
+        for odds, column in cases:
+            self.assertEqual(_crt_odds_column(odds), column, odds)
+        self.assertEqual([_crt_odds_index(odds) for odds in (0.5, 1.0, 2.0, 3.0, 4.0)],
+                         [0, 1, 2, 3, 4])
+
+
+class TestCrtFast(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.crt = load_data()['crt_fast']
+
+    def test_indexed_by_roll(self):
+        crt = self.crt
+        self.assertEqual(len(crt), 21)
+        self.assertIsNone(crt[0])
+        # Rolls in one table band share a row
+        self.assertEqual(crt[1], crt[5])
+        self.assertEqual(crt[6], crt[10])
+        self.assertNotEqual(crt[5], crt[6])
+
+    def test_parsed_rows(self):
+        crt = self.crt
+        self.assertEqual(crt[1], ((30, 0, None), (20, 10, None), (10, 20, None),
+                                  (10, 30, None), (0, 30, None)))
+        self.assertEqual(crt[8], ((20, 0, None), (10, 10, None), (10, 20, 'DR'),
+                                  (10, 20, 'DR'), (0, 20, 'DR')))
+        self.assertEqual(crt[20], ((0, 0, 'AX'), (0, 30, 'DX'), (0, 50, 'DX'),
+                                   (0, 60, 'DX'), (0, 70, 'DX')))
+
+
+class TestCrtParse(unittest.TestCase):
+
+    def test_round_trip(self):
+        data = load_data()
+        crt, crt_fast = data['combat_results_table'], data['crt_fast']
+        for row in crt.to_dict('records'):
+            first_roll = int(row['d20_Roll'].split('-')[0])
+            cells = [row[column] for column in _CRT_COLUMNS]
+            self.assertEqual([_format_crt_result(r) for r in crt_fast[first_roll]], cells)
+
+    def test_invalid_result(self):
+        crt = load_data()['combat_results_table']
+        crt.loc[0, '1:1'] = 'A-10/D-20_XX'
+        with self.assertRaises(ValueError):
+            _build_crt_fast(crt)
+
+
+class TestGameState(EngineTestCase):
+
+    def test_unit_view_follows_unit_table(self):
+        engine = self.engine
+        engine.current_phase = Phase.PLAYER_ACTION
+        view = engine._get_game_state(Faction.ROC)['unit_view']
+        self.assertEqual(view.unit_ids, list(engine.units))
+        self.assertEqual(view.strength.tolist(), [u.strength for u in engine.units.values()])
+
+        unit = _land_pla_unit(engine, 'A1')
+        _quiet(unit.take_damage, 30)
+        engine.current_phase = Phase.COMBAT_RESOLUTION
+        game_state = engine._get_game_state(Faction.ROC)
+        # The view is refilled in place and older snapshots are dropped
+        self.assertIs(game_state['unit_view'], view)
+        self.assertEqual(list(engine._state_cache), 
+                         [(1, Phase.COMBAT_RESOLUTION, Faction.ROC)])
+        self.assertEqual(view.unit_ids[-1], unit.unit_id)
+        self.assertEqual(view.faction[-1], Faction.PLA)
+        self.assertEqual(view.strength[-1], 70)
+        self.assertEqual(view.location_hex_idx[-1], engine.hex_index['A1'])
+
+
+class TestForceTotals(EngineTestCase):
+
+    def test_totals_follow_unit_table(self):
+        engine = self.engine
+        units, strength = engine.force_totals()
+        self.assertEqual(units, {Faction.PLA: 0, Faction.ROC: 20})
+        self.assertEqual(strength, {Faction.PLA: 0, Faction.ROC: 1820})
+
+        unit = _land_pla_unit(engine, 'A1')
+        _quiet(unit.take_damage, 30)
+        units, strength = engine.force_totals()
+        self.assertEqual(units, {Faction.PLA: 1, Faction.ROC: 20})
+        self.assertEqual(strength, {Faction.PLA: 70, Faction.ROC: 1820})
+
+    def test_turn_summary_fallback(self):
+        engine = self.engine
+        _land_pla_unit(engine, 'A1')
+        summary = generate_turn_summary(engine, 1)
+        self.assertEqual((summary['pla_units'], summary['pla_strength']), (1, 100))
+        self.assertEqual((summary['roc_units'], summary['roc_strength']), (20, 1820))
+
+
+if __name__ == '__main__':
+    unittest.main()
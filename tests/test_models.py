@@ -0,0 +1,39 @@
+# ==============================================================================
+# T-GCSM v2.0: Taiwan Ground Combat Simulation Model
+# tests/test_models.py - 모델 테스트
+# ==============================================================================
+
+import contextlib
+import io
+import unittest
+
+from tgcsm import load_data, SimulationEngine, ScriptedAgent
+
+
+class TestUnitTable(unittest.TestCase):
+
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.engine = SimulationEngine(load_data(), ScriptedAgent, ScriptedAgent,
+                                           seed=42)
+
+    def test_batch_damage_matches_unit_damage(self):
+        engine = self.engine
+        units = list(engine.units.values())
+        batch, single = units[:10], units[10:]
+        # Odd strengths lose a half that rounds to even (37.5 -> 38, 12.5 -> 12)
+        for unit, strength in zip(batch + single, [100, 75, 25, 5, 1] * 4):
+            unit._set_strength(strength)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.unit_table.take_damage(batch, 50)
+            for unit in single:
+                unit.take_damage(50)
+        self.assertEqual([u.strength for u in batch], [u.strength for u in single])
+        self.assertEqual([u.strength for u in batch], [50, 37, 13, 3, 1] * 2)
+        table = engine.unit_table
+        self.assertEqual(table.strength[table.rows_of(units)].tolist(),
+                         [u.strength for u in units])
+
+
+if __name__ == '__main__':
+    unittest.main()
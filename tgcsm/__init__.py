@@ -13,7 +13,7 @@ based on the CSIS report "The First Battle of the Next War: Wargaming a Chinese
 from .config import __version__, __author__
 from .enums import *
 from .data_loader import load_data
-from .models import Hex, Unit
+from .models import Hex, Unit, UnitTable, UnitView
 from .agents import Agent, HumanAgent, ScriptedAgent
 from .engine import SimulationEngine
 from .analysis import print_final_summary, export_game_data
@@ -39,6 +39,8 @@ __all__ = [
     # Models
     'Hex',
     'Unit',
+    'UnitTable',
+    'UnitView',
     
     # Agents
     'Agent',
@@ -9,8 +9,74 @@ Includes abstract base class and concrete implementations for human and AI playe
 """
 
 from abc import ABC, abstractmethod
+from itertools import islice
+import numpy as np
 from .enums import Faction, ActionType
 from .config import ARTILLERY_RANGE
+from .engine import ACTION_TYPE_CODES
+
+# Action type values bound once at import for the agents' hot filters
+_MOVE = ActionType.MOVE.value
+_ATTACK = ActionType.ATTACK.value
+_FORTIFY = ActionType.FORTIFY.value
+_ARTY = ActionType.ARTILLERY_SUPPORT.value
+_PASS = ActionType.PASS.value
+_MOVE_CODE = ACTION_TYPE_CODES[_MOVE]
+
+# Maximum number of options HumanAgent lists per action type
+_DISPLAY_LIMIT = 10
+
+_ACTION_MENU = """
+Available action types:
+1. Move units
+2. Attack
+3. Fortify
+4. Artillery support
+5. Pass turn"""
+
+
+def _select_best_moves(unit_dist, move_unit, move_dist):
+    """
+    Pick, for every unit, the move that brings it closest to its target.
+    
+    Args:
+        unit_dist: (U,) current distance of each unit to its target
+        move_unit: (M,) index of the unit (into unit_dist) owning each move
+        move_dist: (M,) distance from each move's end hex to its unit's target
+        
+    Returns:
+        (U,) array with the index of the chosen move for each unit, or -1 if
+        no move gets strictly closer. Ties go to the earliest move.
+    """
+    chosen = np.full(len(unit_dist), -1, dtype=np.int64)
+    if len(move_unit) == 0:
+        return chosen
+    
+    # Stable sort by (unit, distance): the first move of each unit's run is its best
+    order = np.lexsort((move_dist, move_unit))
+    sorted_units = move_unit[order]
+    first = np.flatnonzero(np.r_[True, sorted_units[1:] != sorted_units[:-1]])
+    best = order[first]
+    units = sorted_units[first]
+    
+    improves = move_dist[best] < unit_dist[units]
+    chosen[units[improves]] = best[improves]
+    return chosen
+
+
+def _parse_index(text, n):
+    """
+    Parse a menu selection typed by the player.
+    
+    Returns:
+        The index as an int if it is a valid index into a list of length n,
+        otherwise None
+    """
+    try:
+        i = int(text)
+    except ValueError:
+        return None
+    return i if 0 <= i < n else None
 
 
 class Agent(ABC):
@@ -20,8 +86,12 @@ class Agent(ABC):
     Attributes:
         faction (Faction): The faction this agent controls (PLA or ROC)
         engine: Reference to the simulation engine for helper functions
+        lazy_actions (bool): If True, the engine passes possible_actions as a
+            callable instead of a list (see choose_actions)
     """
     
+    lazy_actions = False
+    
     def __init__(self, faction: Faction, engine):
         """
         Initialize the agent.
@@ -40,7 +110,9 @@ class Agent(ABC):
         
         Args:
             game_state: Dictionary containing complete game state
-            possible_actions: List of all valid actions
+            possible_actions: List of all valid actions or, if lazy_actions
+                is set, a callable taking a collection of ActionType values
+                and returning an iterator over the valid actions of those types
             
         Returns:
             List of chosen actions to execute
@@ -51,96 +123,123 @@ class Agent(ABC):
 class HumanAgent(Agent):
     """
     Human player agent that accepts input through console prompts.
+    
+    Only a few actions per type are ever displayed, so the agent takes
+    possible actions lazily and enumerates just the ones it shows.
     """
     
-    def choose_actions(self, game_state: dict, possible_actions: list) -> list:
+    lazy_actions = True
+    
+    def choose_actions(self, game_state: dict, possible_actions) -> list:
         """
         Interactively prompt the human player to choose actions.
+        
+        Args:
+            game_state: Dictionary containing complete game state
+            possible_actions: Callable returning an iterator over the valid
+                actions of the given ActionType values
         """
-        print(f"\n--- {self.faction.value} Player's Turn ---")
+        print(f"\n--- {self.faction.name} Player's Turn ---")
         print(f"Turn {game_state['turn_number']}")
         
-        # Show unit status
+        # Show unit status (formatted once per turn)
         my_units = [u for u in game_state['unit_data'] 
-                   if u['faction'] == self.faction.value and u['strength'] > 0]
-        print(f"\nYour units ({len(my_units)} total):")
-        for unit in my_units:
-            print(f"  {unit['unit_id']}: {unit['unit_type']} at {unit['location_hex_id']} "
-                  f"(Str: {unit['strength']}, Moved: {unit['has_moved']}, "
-                  f"Attacked: {unit['has_attacked']})")
-        
-        # Group actions by type
-        move_actions = [a for a in possible_actions if a['action'] == ActionType.MOVE.value]
-        attack_actions = [a for a in possible_actions if a['action'] == ActionType.ATTACK.value]
-        fortify_actions = [a for a in possible_actions if a['action'] == ActionType.FORTIFY.value]
-        arty_actions = [a for a in possible_actions if a['action'] == ActionType.ARTILLERY_SUPPORT.value]
+                   if u['faction'] == self.faction and u['strength'] > 0]
+        unit_status_str = "\n".join(
+            [f"\nYour units ({len(my_units)} total):"] +
+            [f"  {unit['unit_id']}: {unit['unit_type']} at {unit['location_hex_id']} "
+             f"(Str: {unit['strength']}, Moved: {unit['has_moved']}, "
+             f"Attacked: {unit['has_attacked']})" for unit in my_units])
+        print(unit_status_str)
+        
+        moved_units = set()  # Units whose move has already been chosen
+        
+        def first_actions(action_type):
+            """Enumerate only the displayable actions of one type."""
+            actions = possible_actions((action_type,))
+            if action_type == _MOVE:
+                actions = (a for a in actions if a['unit_id'] not in moved_units)
+            return list(islice(actions, _DISPLAY_LIMIT))
         
         chosen_actions = []
+        dirty = True  # Redraw the menu only when the chosen actions changed
         
         while True:
-            print("\nAvailable action types:")
-            print("1. Move units")
-            print("2. Attack")
-            print("3. Fortify")
-            print("4. Artillery support")
-            print("5. Pass turn")
+            if dirty:
+                print(_ACTION_MENU)
+                dirty = False
             
             choice = input("Choose action type (1-5): ").strip()
             
-            if choice == '1' and move_actions:
-                # Show available moves
-                print("\nAvailable moves:")
-                for i, action in enumerate(move_actions[:10]):  # Limit display
-                    print(f"{i}: Move {action['unit_id']} to {action['path'][-1]}")
-                
-                idx = input("Select move index (or 'back'): ").strip()
-                if idx.isdigit() and 0 <= int(idx) < len(move_actions):
-                    chosen_actions.append(move_actions[int(idx)])
-                    # Remove this unit's actions from future options
-                    unit_id = move_actions[int(idx)]['unit_id']
-                    move_actions = [a for a in move_actions if a['unit_id'] != unit_id]
+            if choice == '1':
+                move_actions = first_actions(_MOVE)
+                if move_actions:
+                    # Show available moves
+                    print("\nAvailable moves:")
+                    for i, action in enumerate(move_actions):
+                        print(f"{i}: Move {action['unit_id']} to {action['path'][-1]}")
+                    
+                    idx = _parse_index(input("Select move index (or 'back'): ").strip(), 
+                                       len(move_actions))
+                    if idx is not None:
+                        chosen_actions.append(move_actions[idx])
+                        dirty = True
+                        # Remove this unit's actions from future options
+                        moved_units.add(move_actions[idx]['unit_id'])
+                    
+            elif choice == '2':
+                attack_actions = first_actions(_ATTACK)
+                if attack_actions:
+                    # Show available attacks
+                    print("\nAvailable attacks:")
+                    for i, action in enumerate(attack_actions):
+                        print(f"{i}: Attack {action['target_hex']} with {action['attacking_units']}")
+                    
+                    idx = _parse_index(input("Select attack index (or 'back'): ").strip(), 
+                                       len(attack_actions))
+                    if idx is not None:
+                        chosen_actions.append(attack_actions[idx])
+                        dirty = True
                     
-            elif choice == '2' and attack_actions:
-                # Show available attacks
-                print("\nAvailable attacks:")
-                for i, action in enumerate(attack_actions[:10]):
-                    print(f"{i}: Attack {action['target_hex']} with {action['attacking_units']}")
-                
-                idx = input("Select attack index (or 'back'): ").strip()
-                if idx.isdigit() and 0 <= int(idx) < len(attack_actions):
-                    chosen_actions.append(attack_actions[int(idx)])
+            elif choice == '3':
+                fortify_actions = first_actions(_FORTIFY)
+                if fortify_actions:
+                    # Show units that can fortify
+                    print("\nUnits that can fortify:")
+                    for i, action in enumerate(fortify_actions):
+                        print(f"{i}: Fortify {action['unit_id']}")
                     
-            elif choice == '3' and fortify_actions:
-                # Show units that can fortify
-                print("\nUnits that can fortify:")
-                for i, action in enumerate(fortify_actions[:10]):
-                    print(f"{i}: Fortify {action['unit_id']}")
-                
-                idx = input("Select fortify index (or 'back'): ").strip()
-                if idx.isdigit() and 0 <= int(idx) < len(fortify_actions):
-                    chosen_actions.append(fortify_actions[int(idx)])
+                    idx = _parse_index(input("Select fortify index (or 'back'): ").strip(), 
+                                       len(fortify_actions))
+                    if idx is not None:
+                        chosen_actions.append(fortify_actions[idx])
+                        dirty = True
                     
-            elif choice == '4' and arty_actions:
-                # Show artillery support options
-                print("\nArtillery support options:")
-                for i, action in enumerate(arty_actions[:10]):
-                    print(f"{i}: {action['unit_id']} support attack on {action['target_hex']}")
-                
-                idx = input("Select artillery index (or 'back'): ").strip()
-                if idx.isdigit() and 0 <= int(idx) < len(arty_actions):
-                    chosen_actions.append(arty_actions[int(idx)])
+            elif choice == '4':
+                arty_actions = first_actions(_ARTY)
+                if arty_actions:
+                    # Show artillery support options
+                    print("\nArtillery support options:")
+                    for i, action in enumerate(arty_actions):
+                        print(f"{i}: {action['unit_id']} support attack on {action['target_hex']}")
+                    
+                    idx = _parse_index(input("Select artillery index (or 'back'): ").strip(), 
+                                       len(arty_actions))
+                    if idx is not None:
+                        chosen_actions.append(arty_actions[idx])
+                        dirty = True
                     
             elif choice == '5':
                 # Pass turn
                 if not chosen_actions:
-                    return [{'action': ActionType.PASS.value}]
+                    return [{'action': _PASS}]
                 else:
                     confirm = input("End turn with current actions? (y/n): ").strip().lower()
                     if confirm == 'y':
                         return chosen_actions
             
             # Show chosen actions so far
-            if chosen_actions:
+            if dirty:
                 print(f"\nChosen actions so far: {len(chosen_actions)}")
 
 
@@ -153,123 +252,204 @@ class ScriptedAgent(Agent):
     - ROC: Intercept nearest enemy units
     """
     
+    def __init__(self, faction: Faction, engine):
+        """Initialize the agent and bind its faction's strategy."""
+        super().__init__(faction, engine)
+        # Resolve the per-faction branch once instead of on every turn
+        self._choose = self._choose_pla if faction == Faction.PLA else self._choose_roc
+        # Scratch containers reused across turns; cleared at the start of each
+        self._units_acted = set()
+        self._actions_buf = []
+    
+    def _choose_moves(self, unit_view, rows, unit_target, views):
+        """
+        Choose the best move for each unit towards its own target hex.
+        
+        Candidate moves are selected from the columnar action views with
+        boolean masks, and distance ranking runs as a single vectorized pass
+        (_select_best_moves).
+        
+        Args:
+            unit_view: UnitView snapshot from game_state
+            rows: UnitView rows of units still free to move, in engine order
+            unit_target: Target hex index for each unit, aligned with rows
+            views: Columnar action views from engine.build_action_views
+            
+        Returns:
+            List of (unit_id, move_action) pairs for units that can get closer
+        """
+        unit_ids = [unit_view.unit_ids[i] for i in rows]
+        
+        # Map each unit in the views to its position in rows (-1 if not listed);
+        # the trailing -1 is hit by rows without a unit (unit_idx == -1)
+        unit_pos = {uid: i for i, uid in enumerate(unit_ids)}
+        view_to_unit = np.array([unit_pos.get(uid, -1) for uid in views['unit_ids']] + [-1],
+                                dtype=np.int64)
+        
+        move_rows = np.flatnonzero(views['action_type'] == _MOVE_CODE)
+        move_unit = view_to_unit[views['unit_idx'][move_rows]]
+        mine = move_unit >= 0
+        move_rows = move_rows[mine]
+        move_unit = move_unit[mine]
+        move_end = views['end_hex_idx'][move_rows]
+        
+        unit_loc = unit_view.location_hex_idx[rows]
+        
+        unit_dist = self.engine.bulk_hex_distance(unit_loc, unit_target)
+        move_dist = self.engine.bulk_hex_distance(move_end, unit_target[move_unit])
+        chosen = _select_best_moves(unit_dist, move_unit, move_dist)
+        
+        actions = views['actions']
+        return [(uid, actions[move_rows[m]]) 
+                for uid, m in zip(unit_ids, chosen.tolist()) if m >= 0]
+    
     def choose_actions(self, game_state: dict, possible_actions: list) -> list:
         """
         Choose actions based on simple heuristic rules.
         """
         if not possible_actions:
-            return [{'action': ActionType.PASS.value}]
+            return [{'action': _PASS}]
+        return self._choose(game_state, possible_actions)
+    
+    def _prepare(self, game_state, possible_actions):
+        """
+        Collect the per-turn inputs shared by both strategies.
         
-        actions_to_take = []
-        units_acted = set()
+        Returns:
+            Tuple (unit_view, my_rows, attacks, fortify_by_unit, has_move).
+            my_rows are my living units' UnitView rows in engine order; engine
+            order is kept on purpose because it decides move execution order
+            and therefore hex occupancy order.
+        """
+        unit_view = game_state['unit_view']
+        my_rows = np.flatnonzero((unit_view.faction == self.faction) & 
+                                 (unit_view.strength > 0)).tolist()
         
-        # Get my units
-        my_units = [u for u in game_state['unit_data'] 
-                   if u['faction'] == self.faction.value and u['strength'] > 0]
+        # Attacks and fortifies bucketed in one pass
+        attacks = []
+        fortify_by_unit = {}
+        has_move = False
         
-        if self.faction == Faction.PLA:
-            # PLA strategy: Capture victory points
-            primary_target = 'A10'  # Taipei
-            secondary_target = 'G2'  # Kaohsiung
-            
-            # Check if Taipei is already captured
-            taipei_owner = game_state['map_data']['A10']['owner']
-            if taipei_owner == 'PLA':
-                primary_target = secondary_target
-            
-            # 1. Execute attacks first
-            for action in possible_actions:
-                if action['action'] == ActionType.ATTACK.value:
-                    # Check if any attacking unit hasn't acted yet
-                    can_act = any(uid not in units_acted for uid in action['attacking_units'])
-                    if can_act:
-                        actions_to_take.append(action)
-                        for uid in action['attacking_units']:
-                            units_acted.add(uid)
-            
-            # 2. Move units towards objectives
-            available_units = [u for u in my_units if u['unit_id'] not in units_acted]
-            for unit in available_units:
-                if not unit['location_hex_id']:
-                    continue
-                
-                best_move = None
-                min_dist = self.engine.get_hex_distance(unit['location_hex_id'], primary_target)
-                
-                for action in possible_actions:
-                    if (action['action'] == ActionType.MOVE.value and 
-                        action['unit_id'] == unit['unit_id']):
-                        end_hex = action['path'][-1]
-                        dist_primary = self.engine.get_hex_distance(end_hex, primary_target)
-                        
-                        if dist_primary < min_dist:
-                            min_dist = dist_primary
-                            best_move = action
-                
-                if best_move:
-                    actions_to_take.append(best_move)
-                    units_acted.add(unit['unit_id'])
-        
-        elif self.faction == Faction.ROC:
-            # ROC strategy: Defend and intercept
-            pla_units = [u for u in game_state['unit_data'] 
-                        if u['faction'] == 'PLA' and u['location_hex_id']]
-            
-            if not pla_units:
-                return [{'action': ActionType.PASS.value}]
+        for action in possible_actions:
+            action_type = action['action']
+            if action_type == _MOVE:
+                has_move = True
+            elif action_type == _ATTACK:
+                attacks.append(action)
+            elif action_type == _FORTIFY:
+                fortify_by_unit.setdefault(action['unit_id'], action)
+        
+        return unit_view, my_rows, attacks, fortify_by_unit, has_move
+    
+    @staticmethod
+    def _take_attacks(attacks, actions_to_take, units_acted):
+        """Take each attack that still has at least one unit free to act."""
+        for action in attacks:
+            can_act = any(uid not in units_acted for uid in action['attacking_units'])
+            if can_act:
+                actions_to_take.append(action)
+                units_acted.update(action['attacking_units'])
+    
+    def _choose_pla(self, game_state, possible_actions):
+        """PLA strategy: capture victory points (Taipei, then Kaohsiung)."""
+        unit_view, my_rows, attacks, _, has_move = self._prepare(game_state, 
+                                                                 possible_actions)
+        
+        # PLA only moves and attacks, so nothing else is worth evaluating
+        if not my_rows or not (has_move or attacks):
+            return [{'action': _PASS}]
+        
+        actions_to_take = self._actions_buf
+        units_acted = self._units_acted
+        actions_to_take.clear()
+        units_acted.clear()
+        unit_ids = unit_view.unit_ids
+        unit_loc = unit_view.location_hex_idx
+        
+        primary_target = 'A10'  # Taipei
+        secondary_target = 'G2'  # Kaohsiung
+        
+        # Check if Taipei is already captured
+        taipei_owner = game_state['map_data']['A10']['owner']
+        if taipei_owner == Faction.PLA:
+            primary_target = secondary_target
+        
+        # 1. Execute attacks first
+        self._take_attacks(attacks, actions_to_take, units_acted)
+        
+        # 2. Move units towards objectives
+        if has_move:
+            views = self.engine.build_action_views(possible_actions)
+            available = [i for i in my_rows 
+                         if unit_ids[i] not in units_acted and unit_loc[i] >= 0]
+            targets = np.full(len(available), self.engine.hex_index[primary_target], 
+                              dtype=np.int64)
             
-            # 1. Execute attacks on adjacent enemies
-            for action in possible_actions:
-                if action['action'] == ActionType.ATTACK.value:
-                    can_act = any(uid not in units_acted for uid in action['attacking_units'])
-                    if can_act:
-                        actions_to_take.append(action)
-                        for uid in action['attacking_units']:
-                            units_acted.add(uid)
+            for unit_id, best_move in self._choose_moves(unit_view, available, targets, views):
+                actions_to_take.append(best_move)
+                units_acted.add(unit_id)
+        
+        # Return a copy of the chosen actions, or PASS if none
+        if not actions_to_take:
+            return [{'action': _PASS}]
+        
+        return list(actions_to_take)
+    
+    def _choose_roc(self, game_state, possible_actions):
+        """ROC strategy: defend victory points and intercept PLA units."""
+        unit_view, my_rows, attacks, fortify_by_unit, has_move = self._prepare(
+            game_state, possible_actions)
+        if not my_rows:
+            return [{'action': _PASS}]
+        
+        unit_ids = unit_view.unit_ids
+        unit_loc = unit_view.location_hex_idx
+        pla_locs = unit_loc[(unit_view.faction == Faction.PLA) & 
+                            (unit_view.strength > 0) & (unit_loc >= 0)]
+        
+        if not len(pla_locs):
+            return [{'action': _PASS}]
+        
+        actions_to_take = self._actions_buf
+        units_acted = self._units_acted
+        actions_to_take.clear()
+        units_acted.clear()
+        
+        # 1. Execute attacks on adjacent enemies
+        self._take_attacks(attacks, actions_to_take, units_acted)
+        
+        # 2. Move towards nearest enemy
+        if has_move:
+            views = self.engine.build_action_views(possible_actions)
+            available = [i for i in my_rows 
+                         if unit_ids[i] not in units_acted and unit_loc[i] >= 0]
             
-            # 2. Move towards nearest enemy
-            available_units = [u for u in my_units if u['unit_id'] not in units_acted]
-            for unit in available_units:
-                if not unit['location_hex_id']:
-                    continue
-                
-                # Find closest enemy
-                closest_enemy = min(pla_units, 
-                                  key=lambda e: self.engine.get_hex_distance(
-                                      unit['location_hex_id'], e['location_hex_id']))
-                
-                best_move = None
-                min_dist = self.engine.get_hex_distance(
-                    unit['location_hex_id'], closest_enemy['location_hex_id'])
-                
-                for action in possible_actions:
-                    if (action['action'] == ActionType.MOVE.value and 
-                        action['unit_id'] == unit['unit_id']):
-                        end_hex = action['path'][-1]
-                        dist = self.engine.get_hex_distance(
-                            end_hex, closest_enemy['location_hex_id'])
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_move = action
-                
-                if best_move:
-                    actions_to_take.append(best_move)
-                    units_acted.add(unit['unit_id'])
+            # Find closest enemy for each unit: one (units x enemies) distance
+            # matrix; argmin keeps the first enemy on ties, like min() did
+            pla_locs = pla_locs.astype(np.int64)
+            dist_matrix = self.engine.bulk_hex_distance(unit_loc[available][:, None], 
+                                                        pla_locs[None, :])
+            targets = pla_locs[dist_matrix.argmin(axis=1)]
             
-            # 3. Fortify units in victory points
-            for unit in my_units:
-                if (unit['unit_id'] not in units_acted and 
-                    unit['location_hex_id'] and
-                    game_state['map_data'][unit['location_hex_id']]['is_victory_point']):
-                    fortify_actions = [a for a in possible_actions 
-                                     if a['action'] == ActionType.FORTIFY.value and 
-                                     a['unit_id'] == unit['unit_id']]
-                    if fortify_actions:
-                        actions_to_take.append(fortify_actions[0])
-                        units_acted.add(unit['unit_id'])
-        
-        # Return chosen actions or PASS if none
+            for unit_id, best_move in self._choose_moves(unit_view, available, targets, views):
+                actions_to_take.append(best_move)
+                units_acted.add(unit_id)
+        
+        # 3. Fortify units in victory points
+        hex_ids = self.engine.hex_ids
+        vp_hexes = self.engine.vp_hexes
+        for i in my_rows:
+            unit_id = unit_ids[i]
+            if (unit_id not in units_acted and 
+                unit_loc[i] >= 0 and
+                hex_ids[unit_loc[i]] in vp_hexes):
+                fortify_action = fortify_by_unit.get(unit_id)
+                if fortify_action:
+                    actions_to_take.append(fortify_action)
+                    units_acted.add(unit_id)
+        
+        # Return a copy of the chosen actions, or PASS if none
         if not actions_to_take:
-            return [{'action': ActionType.PASS.value}]
+            return [{'action': _PASS}]
         
-        return actions_to_take
\ No newline at end of file
+        return list(actions_to_take)
\ No newline at end of file
@@ -8,8 +8,15 @@ Post-game analysis functions for T-GCSM v2.0
 Provides summary statistics and visualization capabilities.
 """
 
+import collections
+import csv
+import sys
+from .config import TURN_DURATION
 from .enums import Faction, UnitType
 
+# Column order of the exported map control CSV
+_MAP_EXPORT_FIELDS = ['hex_id', 'name', 'owner', 'terrain', 'is_vp', 'units']
+
 
 def print_final_summary(engine):
     """
@@ -18,139 +25,153 @@ def print_final_summary(engine):
     Args:
         engine: The SimulationEngine instance after game completion
     """
-    print("\n" + "="*60)
-    print("FINAL GAME SUMMARY")
-    print("="*60)
+    # Collect every line and write them in one call at the end
+    lines = []
+    emit = lines.append
+    
+    emit("\n" + "="*60)
+    emit("FINAL GAME SUMMARY")
+    emit("="*60)
     
     # Basic info
-    print(f"\nGame Duration: {engine.turn_number} turns ({engine.turn_number * 3.5:.1f} days)")
+    emit(f"\nGame Duration: {engine.turn_number} turns ({engine.turn_number * TURN_DURATION:.1f} days)")
     
-    if engine.winner:
-        print(f"Winner: {engine.winner.value}")
+    if engine.winner is not None:
+        emit(f"Winner: {engine.winner.name}")
         if engine.winner == Faction.PLA:
-            print("Victory Type: Conquest (Taipei captured)")
+            emit("Victory Type: Conquest (Taipei captured)")
         else:
-            print("Victory Type: Survival (Taiwan maintains autonomy)")
+            emit("Victory Type: Survival (Taiwan maintains autonomy)")
     else:
-        print("Result: Stalemate")
+        emit("Result: Stalemate")
     
     # Force summary
-    print("\n" + "-"*40)
-    print("FINAL FORCE STATUS")
-    print("-"*40)
+    emit("\n" + "-"*40)
+    emit("FINAL FORCE STATUS")
+    emit("-"*40)
     
     # Get final state
     final_state = engine._get_game_state(Faction.PLA)
     
+    # Split units by faction in one pass, with the appends bound once
+    pla_units, roc_units = [], []
+    append_pla, append_roc = pla_units.append, roc_units.append
+    pla = Faction.PLA
+    for u in final_state['unit_data']:
+        (append_pla if u['faction'] == pla else append_roc)(u)
+    
     # PLA summary
-    print("\nPLA Forces:")
-    pla_units = [u for u in final_state['unit_data'] if u['faction'] == 'PLA']
-    print_force_summary(pla_units, "PLA")
+    emit("\nPLA Forces:")
+    lines.extend(_force_summary_lines(pla_units, "PLA"))
     
     # ROC summary
-    print("\nROC Forces:")
-    roc_units = [u for u in final_state['unit_data'] if u['faction'] == 'ROC']
-    print_force_summary(roc_units, "ROC")
+    emit("\nROC Forces:")
+    lines.extend(_force_summary_lines(roc_units, "ROC"))
     
     # Territory control
-    print("\n" + "-"*40)
-    print("TERRITORY CONTROL")
-    print("-"*40)
-    
-    pla_hexes = 0
-    roc_hexes = 0
+    emit("\n" + "-"*40)
+    emit("TERRITORY CONTROL")
+    emit("-"*40)
+    
+    map_data = final_state['map_data']
+    owner_counts = collections.Counter(h['owner'] for h in map_data.values())
+    total_hexes = len(map_data)
+    pla_hexes = owner_counts[Faction.PLA]
+    roc_hexes = total_hexes - pla_hexes
+    
+    # Key locations (VPs, ports, airfields) are static, so the engine lists them
+    # already sorted by hex ID; the fields the report needs are pulled out once
     key_locations = []
-    
-    for hex_id, hex_data in final_state['map_data'].items():
-        if hex_data['owner'] == 'PLA':
-            pla_hexes += 1
-        else:
-            roc_hexes += 1
-        
-        # Track key locations
-        if hex_data['is_victory_point'] or hex_data['port_status'] or hex_data['airfield_status']:
-            key_locations.append((hex_id, hex_data))
-    
-    total_hexes = pla_hexes + roc_hexes
-    print(f"\nPLA controls: {pla_hexes} hexes ({pla_hexes/total_hexes*100:.1f}%)")
-    print(f"ROC controls: {roc_hexes} hexes ({roc_hexes/total_hexes*100:.1f}%)")
-    
-    print("\nKey Locations:")
-    for hex_id, hex_data in sorted(key_locations, key=lambda x: x[0]):
-        status_parts = []
-        if hex_data['is_victory_point']:
-            status_parts.append("VP")
-        if hex_data['port_status']:
-            status_parts.append(f"Port-{hex_data['port_status']}")
-        if hex_data['airfield_status']:
-            status_parts.append(f"Airfield-{hex_data['airfield_status']}")
-        
-        status = ", ".join(status_parts)
-        print(f"  - {hex_data['name']} ({hex_id}): {hex_data['owner']} [{status}]")
+    for hex_id in final_state['key_location_ids']:
+        h = map_data[hex_id]
+        key_locations.append((hex_id, h['name'], h['owner'], h['is_victory_point'], 
+                              h['port_status'], h['airfield_status']))
+    emit(f"\nPLA controls: {pla_hexes} hexes ({pla_hexes/total_hexes*100:.1f}%)")
+    emit(f"ROC controls: {roc_hexes} hexes ({roc_hexes/total_hexes*100:.1f}%)")
+    
+    emit("\nKey Locations:")
+    for hex_id, name, owner, is_vp, port_status, airfield_status in key_locations:
+        status = ", ".join(filter(None, (
+            "VP" if is_vp else None,
+            f"Port-{port_status}" if port_status else None,
+            f"Airfield-{airfield_status}" if airfield_status else None,
+        )))
+        emit(f"  - {name} ({hex_id}): {Faction(owner).name} [{status}]")
     
     # Casualties
-    print("\n" + "-"*40)
-    print("CASUALTIES")
-    print("-"*40)
+    emit("\n" + "-"*40)
+    emit("CASUALTIES")
+    emit("-"*40)
     
     # Calculate casualties
     pla_casualties = calculate_casualties(engine, Faction.PLA)
     roc_casualties = calculate_casualties(engine, Faction.ROC)
     
-    print(f"\nPLA Casualties: {pla_casualties['total_strength_lost']} strength points")
-    print(f"  - Units destroyed: {pla_casualties['units_destroyed']}")
-    print(f"  - Units damaged: {pla_casualties['units_damaged']}")
+    emit(f"\nPLA Casualties: {pla_casualties['total_strength_lost']} strength points")
+    emit(f"  - Units destroyed: {pla_casualties['units_destroyed']}")
+    emit(f"  - Units damaged: {pla_casualties['units_damaged']}")
     
-    print(f"\nROC Casualties: {roc_casualties['total_strength_lost']} strength points")
-    print(f"  - Units destroyed: {roc_casualties['units_destroyed']}")
-    print(f"  - Units damaged: {roc_casualties['units_damaged']}")
+    emit(f"\nROC Casualties: {roc_casualties['total_strength_lost']} strength points")
+    emit(f"  - Units destroyed: {roc_casualties['units_destroyed']}")
+    emit(f"  - Units damaged: {roc_casualties['units_damaged']}")
     
     # Strategic assessment
-    print("\n" + "-"*40)
-    print("STRATEGIC ASSESSMENT")
-    print("-"*40)
+    emit("\n" + "-"*40)
+    emit("STRATEGIC ASSESSMENT")
+    emit("-"*40)
     
     if engine.winner == Faction.PLA:
-        print("\nPLA achieved strategic objectives:")
-        print("- Successfully established beachhead")
-        print("- Captured key victory points")
-        print("- Overcame ROC defensive positions")
+        emit("\nPLA achieved strategic objectives:")
+        emit("- Successfully established beachhead")
+        emit("- Captured key victory points")
+        emit("- Overcame ROC defensive positions")
     else:
-        print("\nROC achieved strategic objectives:")
-        print("- Prevented PLA conquest")
-        print("- Maintained control of key areas")
-        print("- Inflicted sufficient attrition on invasion force")
+        emit("\nROC achieved strategic objectives:")
+        emit("- Prevented PLA conquest")
+        emit("- Maintained control of key areas")
+        emit("- Inflicted sufficient attrition on invasion force")
     
     # Remaining reinforcements
     if engine.pla_reinforcement_pool:
-        print(f"\nUncommitted PLA reserves: {len(engine.pla_reinforcement_pool)} battalions")
+        emit(f"\nUncommitted PLA reserves: {len(engine.pla_reinforcement_pool)} battalions")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_force_summary(units, faction_name):
     """Print summary of a faction's forces."""
+    sys.stdout.write("\n".join(_force_summary_lines(units, faction_name)) + "\n")
+
+
+def _force_summary_lines(units, faction_name):
+    """Build the summary of a faction's forces as a list of lines."""
     if not units:
-        print(f"  - No {faction_name} units remaining")
-        return
+        return [f"  - No {faction_name} units remaining"]
     
-    # Count by type
-    unit_counts = {}
+    # Count and sum strength by type
+    unit_counts = collections.Counter()
+    strength_by_type = collections.Counter()
     total_strength = 0
     
     for unit in units:
         unit_type = unit['unit_type']
-        if unit_type not in unit_counts:
-            unit_counts[unit_type] = {'count': 0, 'strength': 0}
-        unit_counts[unit_type]['count'] += 1
-        unit_counts[unit_type]['strength'] += unit['strength']
-        total_strength += unit['strength']
-    
-    print(f"  - Total units: {len(units)}")
-    print(f"  - Total strength: {total_strength}")
-    print("  - By type:")
-    
-    for unit_type, data in sorted(unit_counts.items()):
-        avg_strength = data['strength'] / data['count']
-        print(f"    * {unit_type}: {data['count']} units (avg strength: {avg_strength:.1f})")
+        strength = unit['strength']
+        unit_counts[unit_type] += 1
+        strength_by_type[unit_type] += strength
+        total_strength += strength
+    
+    lines = [
+        f"  - Total units: {len(units)}",
+        f"  - Total strength: {total_strength}",
+        "  - By type:",
+    ]
+    
+    for unit_type in sorted(unit_counts):
+        count = unit_counts[unit_type]
+        avg_strength = strength_by_type[unit_type] / count
+        lines.append(f"    * {unit_type}: {count} units (avg strength: {avg_strength:.1f})")
+    
+    return lines
 
 
 def calculate_casualties(engine, faction):
@@ -161,85 +182,94 @@ def calculate_casualties(engine, faction):
         'total_strength_lost': 0
     }
     
-    # Check initial setup
-    if faction == Faction.ROC:
-        initial_data = engine.data['oob_roc_initial_setup']
-        for _, row in initial_data.iterrows():
-            unit_id = row['unit_id']
-            initial_strength = row['initial_strength']
-            
-            # Check if unit still exists
-            if unit_id in engine.units:
-                current_unit = engine.units[unit_id]
-                if current_unit.strength < initial_strength:
-                    casualties['units_damaged'] += 1
-                    casualties['total_strength_lost'] += initial_strength - current_unit.strength
-            else:
-                casualties['units_destroyed'] += 1
-                casualties['total_strength_lost'] += initial_strength
-    
-    elif faction == Faction.PLA:
-        # For PLA, check all reinforcements that were deployed
-        initial_pool_size = len(engine.data['oob_pla_reinforcements'])
-        current_pool_size = len(engine.pla_reinforcement_pool)
-        deployed_units = initial_pool_size - current_pool_size
-        
-        # Count PLA units in play
-        pla_units_in_play = [u for u in engine.units.values() if u.faction == Faction.PLA]
-        
-        for unit in pla_units_in_play:
-            if unit.strength < unit.initial_strength:
-                casualties['units_damaged'] += 1
-                casualties['total_strength_lost'] += unit.initial_strength - unit.strength
-        
-        # Destroyed units = deployed - still in play
-        casualties['units_destroyed'] = deployed_units - len(pla_units_in_play)
-        casualties['total_strength_lost'] += casualties['units_destroyed'] * 100
+    # Every unit that entered play: the ROC initial setup and landed PLA units.
+    # Units removed from the game count as destroyed and lose their full
+    # initial strength.
+    initial, current, alive = engine.faction_unit_arrays(faction)
+    lost = initial - current
+    damaged = alive & (lost > 0)
+    
+    casualties['units_destroyed'] = int((~alive).sum())
+    casualties['units_damaged'] = int(damaged.sum())
+    casualties['total_strength_lost'] = int(lost[damaged].sum() + initial[~alive].sum())
     
     return casualties
 
 
 def generate_turn_summary(engine, turn_number):
-    """Generate summary for a specific turn."""
+    """
+    Generate summary for a specific turn.
+    
+    Reads the statistics the engine maintains as the turn plays out, so no
+    game state is rescanned. Unit counts and strength are the end-of-turn
+    totals; for a turn still in progress the live totals are reported.
+    
+    Args:
+        engine: The SimulationEngine instance
+        turn_number: Turn to summarize
+        
+    Returns:
+        dict: Summary statistics for the turn
+    """
+    stats = engine.get_turn_stats(turn_number)
+    
+    units = stats['units']
+    strength = stats['strength']
+    if units is None:
+        units, strength = engine.force_totals()
+    
     summary = {
         'turn': turn_number,
-        'pla_units': 0,
-        'roc_units': 0,
-        'pla_strength': 0,
-        'roc_strength': 0,
-        'combats': 0,
-        'hexes_captured': 0
+        'pla_units': units[Faction.PLA],
+        'roc_units': units[Faction.ROC],
+        'pla_strength': strength[Faction.PLA],
+        'roc_strength': strength[Faction.ROC],
+        'combats': stats['combats'],
+        'hexes_captured': stats['hexes_captured'],
+        'pla_units_destroyed': stats['destroyed'][Faction.PLA],
+        'roc_units_destroyed': stats['destroyed'][Faction.ROC],
+        'pla_strength_lost': stats['strength_lost'][Faction.PLA],
+        'roc_strength_lost': stats['strength_lost'][Faction.ROC],
     }
     
-    # This would require turn-by-turn logging in the engine
-    # For now, return placeholder
     return summary
 
 
-def export_game_data(engine, filename):
-    """Export game data to CSV for external analysis."""
-    import pandas as pd
+def export_game_data(engine, filename, final_state=None):
+    """
+    Export game data to CSV for external analysis.
     
-    # Get final state
-    final_state = engine._get_game_state(Faction.PLA)
+    Args:
+        engine: The SimulationEngine instance after game completion
+        filename: Output path prefix for the CSV files
+        final_state: Optional game state snapshot to reuse
+    """
+    # Get final state (cached on the engine if the summary already built it)
+    if final_state is None:
+        final_state = engine._get_game_state(Faction.PLA)
     
     # Export unit data
-    unit_df = pd.DataFrame(final_state['unit_data'])
-    unit_df.to_csv(f"{filename}_units.csv", index=False)
-    
-    # Export map control
-    map_data = []
-    for hex_id, hex_info in final_state['map_data'].items():
-        map_data.append({
-            'hex_id': hex_id,
-            'name': hex_info['name'],
-            'owner': hex_info['owner'],
-            'terrain': hex_info['terrain_type'],
-            'is_vp': hex_info['is_victory_point'],
-            'units': len(hex_info['unit_ids'])
-        })
-    
-    map_df = pd.DataFrame(map_data)
-    map_df.to_csv(f"{filename}_map.csv", index=False)
+    unit_data = final_state['unit_data']
+    unit_fields = list(unit_data[0]) if unit_data else []
+    with open(f"{filename}_units.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=unit_fields, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(dict(u, faction=Faction(u['faction']).name) for u in unit_data)
+    
+    # Export map control, column by column
+    map_data = final_state['map_data']
+    hexes = list(map_data.values())
+    owner_names = {f.value: f.name for f in Faction}
+    with open(f"{filename}_map.csv", "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(_MAP_EXPORT_FIELDS)
+        writer.writerows(zip(
+            map_data,
+            [h['name'] for h in hexes],
+            [owner_names[h['owner']] for h in hexes],
+            [h['terrain_type'] for h in hexes],
+            [h['is_victory_point'] for h in hexes],
+            [len(h['unit_ids']) for h in hexes],
+        ))
     
     print(f"Game data exported to {filename}_units.csv and {filename}_map.csv")
\ No newline at end of file
@@ -5,19 +5,13 @@
 
 """
 Configuration module for T-GCSM v2.0
-Contains all necessary imports and global configuration settings.
+Contains global configuration settings. Heavy libraries (pandas, numpy) are
+imported by the modules that use them, so reading a constant from here stays
+cheap.
 """
 
 # Standard library imports
-import pandas as pd
-import numpy as np
 import random
-import copy
-from abc import ABC, abstractmethod
-import io
-from enum import Enum
-import re
-import collections
 
 # Version information
 __version__ = "2.0.0"
@@ -50,5 +44,6 @@ VERBOSE_COMBAT = True
 RANDOM_SEED = None
 
 if RANDOM_SEED is not None:
+    import numpy as np
     random.seed(RANDOM_SEED)
     np.random.seed(RANDOM_SEED)
\ No newline at end of file
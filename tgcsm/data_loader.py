@@ -6,18 +6,78 @@
 """
 Data loading module for T-GCSM v2.0
 Loads all necessary CSV data for the simulation using io.StringIO.
+The embedded tables are parsed once per process and shared by all loads.
 """
 
 import pandas as pd
 import io
+import re
+from .config import D20_SIDES
+from functools import lru_cache
+
+# Boolean CSV literals, parsed explicitly so flag columns can never fall back to strings
+_BOOL_LITERALS = {'true_values': ['TRUE'], 'false_values': ['FALSE']}
+
+# Pattern of a CRT cell such as "A-10/D-20_DR"
+_CRT_RESULT_PATTERN = re.compile(r'^A-(\d+)/D-(\d+)(?:_(AR|DR|AX|DX))?$')
 
 
 def load_data():
     """
     Load all simulation data from embedded CSV strings.
     
+    The CSV parser only runs on the first call; later calls get copies of
+    the cached tables, so callers remain free to modify what they receive.
+    
+    Returns:
+        dict: Dictionary containing all dataframes needed for simulation,
+            plus the pre-parsed 'crt_fast' lookup table (see _build_crt_fast)
+    """
+    return {name: table.copy() if isinstance(table, pd.DataFrame) else table
+            for name, table in _parse_tables().items()}
+
+
+def _build_crt_fast(crt):
+    """
+    Pre-parse the combat results table for O(1) lookups.
+    
+    Args:
+        crt: Combat results table DataFrame ('d20_Roll' plus one column per
+            odds ratio, e.g. "1:2" ... "4:1+")
+        
+    Returns:
+        tuple: crt_fast[d20_roll][ratio_idx] = (attacker_loss, defender_loss, flag),
+            where ratio_idx follows the CRT column order and flag is "AR",
+            "DR", "AX", "DX" or None. Index 0 is unused (None).
+    """
+    ratio_columns = [c for c in crt.columns if c != 'd20_Roll']
+    crt_fast = [None] * (D20_SIDES + 1)
+    
+    # Ratio headers like "1:2" are not identifiers, so rows are zipped by hand
+    for values in crt.itertuples(index=False, name=None):
+        row = dict(zip(crt.columns, values))
+        results = []
+        for column in ratio_columns:
+            match = _CRT_RESULT_PATTERN.match(row[column])
+            if not match:
+                raise ValueError(f"Invalid CRT result format: {row[column]}")
+            results.append((int(match.group(1)), int(match.group(2)), match.group(3)))
+        
+        # d20_Roll is either a single roll ("20") or an inclusive span ("1-5")
+        low, _, high = str(row['d20_Roll']).partition('-')
+        for roll in range(int(low), int(high or low) + 1):
+            crt_fast[roll] = tuple(results)
+    
+    return tuple(crt_fast)
+
+
+@lru_cache(maxsize=1)
+def _parse_tables():
+    """
+    Parse the embedded CSV tables.
+    
     Returns:
-        dict: Dictionary containing all dataframes needed for simulation
+        dict: Dictionary of table name -> DataFrame (shared; do not modify)
     """
     data_files = {}
 
@@ -154,7 +214,9 @@ J11,Offshore,Ocean,FALSE,,FALSE,,FALSE,ROC
 J12,Offshore,Ocean,FALSE,,FALSE,,FALSE,ROC
 J13,Offshore,Ocean,FALSE,,FALSE,,FALSE,ROC
 """
-    data_files['hex_map'] = pd.read_csv(io.StringIO(hex_map_csv))
+    data_files['hex_map'] = pd.read_csv(
+        io.StringIO(hex_map_csv), **_BOOL_LITERALS,
+        dtype={'is_port': bool, 'is_airfield': bool, 'is_victory_point': bool})
 
     # --- 부록 B: 마스터 장비 카탈로그 ---
     equipment_catalog_csv = """equipment_id,faction,name,type,main_gun_mm,has_atgm,armor_rating,engine_hp,weight_tonnes,max_speed_kph,amphibious_speed_kph,lift_cost
@@ -206,7 +268,8 @@ PLA_AIRBORNE_BN2,Airborne Division,PLA_AIRBORNE_BN,100,,FALSE,20
 PLA_ENGINEER_BN1,Engineer Regiment,PLA_ENGINEER_BN,100,,FALSE,15
 PLA_HELO_BN1,Army Aviation Brigade,PLA_ATTACK_HELO_BN,100,,FALSE,35
 """
-    data_files['oob_pla_reinforcements'] = pd.read_csv(io.StringIO(oob_pla_reinforcements_csv))
+    data_files['oob_pla_reinforcements'] = pd.read_csv(
+        io.StringIO(oob_pla_reinforcements_csv), **_BOOL_LITERALS, dtype={'is_reserve': bool})
 
     oob_roc_initial_setup_csv = """unit_id,brigade,template_id,initial_strength,location_hex_id,is_reserve,lift_cost
 ROC_ARM_542_BN1,542nd Armor Brigade,ROC_ARM_BN_CM11,100,B10,FALSE,0
@@ -230,7 +293,8 @@ ROC_INF_R_PTG,Reserve Infantry,ROC_INF_BN,80,H3,TRUE,0
 ROC_ARTY_BN1,Artillery Command,ROC_ARTY_BN_155,100,C11,FALSE,0
 ROC_ARTY_BN2,Artillery Command,ROC_ARTY_BN_203,100,E11,FALSE,0
 """
-    data_files['oob_roc_initial_setup'] = pd.read_csv(io.StringIO(oob_roc_initial_setup_csv))
+    data_files['oob_roc_initial_setup'] = pd.read_csv(
+        io.StringIO(oob_roc_initial_setup_csv), **_BOOL_LITERALS, dtype={'is_reserve': bool})
 
     # --- 부록 E: 핵심 메커니즘 데이터 ---
     terrain_modifiers_csv = """terrain_type,movement_cost_factor,defense_multiplier
@@ -253,5 +317,6 @@ Ocean,99.0,1.0
 20,A-0/D-0_AX,A-0/D-30_DX,A-0/D-50_DX,A-0/D-60_DX,A-0/D-70_DX
 """
     data_files['combat_results_table'] = pd.read_csv(io.StringIO(combat_results_table_csv))
+    data_files['crt_fast'] = _build_crt_fast(data_files['combat_results_table'])
 
     return data_files
\ No newline at end of file
@@ -8,13 +8,108 @@ Main simulation engine for T-GCSM v2.0
 Manages game state, enforces rules, and runs the simulation loop.
 """
 
-import random
-import copy
+import bisect
 import collections
-import re
+import functools
+import numpy as np
 from .config import *
 from .enums import *
-from .models import Hex, Unit
+from .models import Hex, Unit, UnitTable, UnitView
+
+# Small integer code for each action type, used by the columnar action views
+ACTION_TYPE_CODES = {action_type.value: code for code, action_type in enumerate(ActionType)}
+
+# Action type values bound once at import for the action loops
+_MOVE = ActionType.MOVE.value
+_ATTACK = ActionType.ATTACK.value
+_FORTIFY = ActionType.FORTIFY.value
+_ARTY = ActionType.ARTILLERY_SUPPORT.value
+_PASS = ActionType.PASS.value
+
+# Only these unit types project a Zone of Control
+_ZOC_PROJECTING = frozenset((UnitType.Armor, UnitType.Mechanized, UnitType.Infantry))
+
+
+def _reachability_kernel(start, movement_points, neighbors, move_cost, in_zoc):
+    """
+    Movement BFS over dense hex indices.
+    
+    Only touches flat int/float/bool sequences, so it can be handed to a
+    JIT compiler unchanged. A hex keeps the first path that reaches it, and
+    a unit stops on entering enemy ZoC (its start hex is exempt).
+    
+    Args:
+        start: Start hex index
+        movement_points: Movement points available
+        neighbors: Neighbor index list per hex
+        move_cost: Entry cost per hex
+        in_zoc: Enemy-ZoC flag per hex
+        
+    Returns:
+        Tuple (order, remaining_mp, parent) of aligned lists in discovery
+        order; the start comes first with parent -1
+    """
+    discovered = [False] * len(move_cost)
+    discovered[start] = True
+    order = [start]
+    remaining_mp = [movement_points]
+    parent = [-1]
+    
+    # order doubles as the FIFO queue: BFS pops hexes in discovery order
+    head = 0
+    while head < len(order):
+        current = order[head]
+        mp = remaining_mp[head]
+        head += 1
+        
+        if current != start and in_zoc[current]:
+            continue
+        
+        for j in neighbors[current]:
+            if not discovered[j]:
+                cost = move_cost[j]
+                if mp >= cost:
+                    discovered[j] = True
+                    order.append(j)
+                    remaining_mp.append(mp - cost)
+                    parent.append(current)
+    
+    return order, remaining_mp, parent
+
+
+# Odds ratio bins: below 0.75 -> '1:2', below 1.5 -> '1:1', ..., 3.5 and up -> '4:1+'
+_ODDS_THRESHOLDS = (0.75, 1.5, 2.5, 3.5)
+# Column labels in CRT order, which is also the crt_fast column index order
+_CRT_COLUMNS = ('1:2', '1:1', '2:1', '3:1', '4:1+')
+
+
+def _crt_odds_index(odds_ratio):
+    """Map an odds ratio to its combat results table column index."""
+    return bisect.bisect_right(_ODDS_THRESHOLDS, odds_ratio)
+
+
+def _crt_odds_column(odds_ratio):
+    """Map an odds ratio to its combat results table column label."""
+    return _CRT_COLUMNS[_crt_odds_index(odds_ratio)]
+
+
+def _format_crt_result(result):
+    """Render a parsed CRT cell back in table form, e.g. "A-10/D-20_DR"."""
+    attacker_loss, defender_loss, special = result
+    text = f"A-{attacker_loss}/D-{defender_loss}"
+    return f"{text}_{special}" if special else text
+
+
+def _new_turn_stats():
+    """Empty per-turn statistics record (see SimulationEngine._turn_stats)."""
+    return {
+        'combats': 0,
+        'hexes_captured': 0,
+        'destroyed': {Faction.PLA: 0, Faction.ROC: 0},
+        'strength_lost': {Faction.PLA: 0, Faction.ROC: 0},
+        'units': None,      # {faction: count}, recorded at end of turn
+        'strength': None,   # {faction: total strength}, recorded at end of turn
+    }
 
 
 class SimulationEngine:
@@ -30,14 +125,26 @@ class SimulationEngine:
         game_over: Whether the game has ended
         winner: Winning faction if game is over
         hexes: Dictionary of all hex objects
+        vp_hexes: Frozenset of victory point hex IDs
         units: Dictionary of all unit objects
         pla_reinforcement_pool: List of PLA units available for reinforcement
     """
     
-    def __init__(self, data_files, pla_agent_class, roc_agent_class):
-        """Initialize the simulation engine."""
+    def __init__(self, data_files, pla_agent_class, roc_agent_class, seed=None):
+        """
+        Initialize the simulation engine.
+        
+        Args:
+            data_files: Tables returned by load_data()
+            pla_agent_class: Agent class playing the PLA
+            roc_agent_class: Agent class playing the ROC
+            seed: Seed for the engine's random generator (default:
+                config.RANDOM_SEED; None draws fresh entropy)
+        """
         print("Initializing Simulation Engine...")
         self.data = data_files
+        # All dice and random choices come from this generator
+        self._rng = np.random.default_rng(RANDOM_SEED if seed is None else seed)
         
         # Instantiate agents with reference to engine
         self.pla_agent = pla_agent_class(Faction.PLA, self)
@@ -51,6 +158,31 @@ class SimulationEngine:
         self.winner = None
         self.pending_combats = []
         
+        # Columnar unit snapshot handed to agents, refilled in place per game state
+        self.unit_view = UnitView()
+        # Engine-private columnar snapshot for whole-army scans
+        self._unit_scan = UnitView()
+        # Latest game state snapshot, keyed by (turn, phase, faction)
+        self._state_cache = {}
+        # Reachability maps keyed by (start, MP, faction, ZoC signature)
+        self._reach_cache = {}
+        # Per-faction supplied-hex and supply-source masks, rebuilt each
+        # supply phase
+        self._supplied = {}
+        self._supply_sources = {}
+        # Per-faction enemy-ZoC flags by hex index; dropped whenever units
+        # move or lose strength
+        self._zoc_maps = {}
+        # Per-turn statistics, updated where the state changes
+        self._turn_stats = collections.defaultdict(_new_turn_stats)
+        # Chosen-action dispatch (PASS and unknown actions have no handler)
+        self._action_handlers = {
+            _MOVE: self._execute_move,
+            _ATTACK: self._declare_attack,
+            _FORTIFY: self._execute_fortify,
+            _ARTY: self._declare_artillery_support,
+        }
+        
         # Air/sea effects variables
         self.is_roc_interdicted = False
         self.pla_cas_available = True
@@ -66,75 +198,290 @@ class SimulationEngine:
     
     def _initialize_map(self):
         """Initialize Hex objects from map data."""
+        # terrain_type -> (defense_multiplier, movement_cost_factor)
+        terrain_df = self.data['terrain_modifiers']
+        terrain_table = dict(zip(
+            terrain_df['terrain_type'], 
+            zip(terrain_df['defense_multiplier'], terrain_df['movement_cost_factor'])
+        ))
+        # Rows are read as plain dicts; boxing each one as a Series is far slower
         self.hexes = {
-            row['hex_id']: Hex(row)
-            for _, row in self.data['hex_map'].iterrows()
+            row['hex_id']: Hex(row, terrain_table)
+            for row in self.data['hex_map'].to_dict('records')
         }
+        
+        # Movement cost of entering each hex (terrain never changes)
+        self._hex_move_cost = {hex_id: 1.0 * h.get_movement_cost() 
+                               for hex_id, h in self.hexes.items()}
+        # Combat results, pre-parsed by the loader: crt_fast[d20 roll][column index]
+        self._crt_fast = self.data['crt_fast']
+        # Victory points, ports and airfields never change during a game
+        self.vp_hexes = frozenset(hex_id for hex_id, h in self.hexes.items() 
+                                  if h.is_victory_point)
+        # Sorted once by hex ID (the report's order); the map itself is in
+        # natural A1, A2, ... order, not string order
+        self._key_location_ids = sorted(hex_id for hex_id, h in self.hexes.items() 
+                                        if h.is_victory_point or h.is_port or h.is_airfield)
+        
+        # Game-state map entries with the immutable fields filled in; the
+        # placeholders fix the key order of the per-call copies
+        self._hex_state_templates = {
+            hex_id: {
+                'name': h.name,
+                'terrain_type': h.terrain_type,
+                'owner': None,
+                'is_victory_point': h.is_victory_point,
+                'port_status': None,
+                'airfield_status': None,
+                'unit_ids': None
+            } for hex_id, h in self.hexes.items()
+        }
+        # Same for units, filled in the first time each unit is reported
+        self._unit_state_templates = {}
     
     def _initialize_units(self):
         """Initialize Unit objects and place them on the map."""
         self.units = {}
         self.pla_reinforcement_pool = []
         
+        # Struct-of-arrays registry of every unit that has entered play, one row
+        # per unit; rows are never reused, so destroyed units keep their history
+        capacity = (len(self.data['oob_roc_initial_setup']) + 
+                    len(self.data['oob_pla_reinforcements']))
+        self.unit_table = UnitTable(capacity)
+        self._units_by_faction = {Faction.PLA: set(), Faction.ROC: set()}
+        
+        # Template combat values are aggregated once and shared by every unit
+        template_stats = Unit.build_template_stats(
+            self.data['battalion_templates'], self.data['equipment_catalog'])
+        
         # Initialize ROC units
-        for _, row in self.data['oob_roc_initial_setup'].iterrows():
+        for row in self.data['oob_roc_initial_setup'].to_dict('records'):
             unit = Unit(
                 row['unit_id'], 
                 row, 
                 self.data['battalion_templates'], 
-                self.data['equipment_catalog']
+                self.data['equipment_catalog'],
+                template_stats
             )
             self.units[unit.unit_id] = unit
+            self._track_unit(unit)
             if unit.location_hex_id and unit.location_hex_id in self.hexes:
-                self.hexes[unit.location_hex_id].units.append(unit)
+                self._place_unit(unit, self.hexes[unit.location_hex_id])
         
         # Create PLA reinforcement pool
-        for _, row in self.data['oob_pla_reinforcements'].iterrows():
+        for row in self.data['oob_pla_reinforcements'].to_dict('records'):
             unit = Unit(
                 row['unit_id'], 
                 row, 
                 self.data['battalion_templates'], 
-                self.data['equipment_catalog']
+                self.data['equipment_catalog'],
+                template_stats
             )
             self.pla_reinforcement_pool.append(unit)
     
+    def _track_unit(self, unit):
+        """Register a unit that has just entered play in the SoA registry."""
+        self.unit_table.add(unit)
+        self._units_by_faction[unit.faction].add(unit.unit_id)
+    
+    def _untrack_unit(self, unit):
+        """Mark a unit removed from play; its registry row is kept."""
+        self.unit_table.remove(unit)
+        self._units_by_faction[unit.faction].discard(unit.unit_id)
+    
+    def _place_unit(self, unit, hex_obj):
+        """Add a unit to a hex's occupants and the per-hex faction counts."""
+        hex_obj.units[unit.unit_id] = unit
+        self.hex_faction_counts[hex_obj.index, unit.faction] += 1
+        self._zoc_maps.clear()
+    
+    def _remove_unit(self, unit, hex_obj):
+        """Remove a unit from a hex's occupants and the per-hex faction counts."""
+        del hex_obj.units[unit.unit_id]
+        self.hex_faction_counts[hex_obj.index, unit.faction] -= 1
+        self._zoc_maps.clear()
+    
+    def _relocate_units(self, units, from_hex, to_hex):
+        """Move a group of units between hexes, updating the counts once per faction."""
+        moved = collections.Counter()
+        for unit in units:
+            to_hex.units[unit.unit_id] = from_hex.units.pop(unit.unit_id)
+            unit.location_hex_id = to_hex.hex_id
+            moved[unit.faction] += 1
+        src = from_hex.index
+        dst = to_hex.index
+        for faction, count in moved.items():
+            self.hex_faction_counts[src, faction] -= count
+            self.hex_faction_counts[dst, faction] += count
+        self._zoc_maps.clear()
+    
+    def _purge_units(self, hex_obj, unit_ids):
+        """
+        Remove every listed unit present in a hex at once.
+        
+        Args:
+            hex_obj: Hex to clear
+            unit_ids: Set of unit IDs to drop
+        """
+        counts = self.hex_faction_counts[hex_obj.index]
+        for unit_id in [uid for uid in hex_obj.units if uid in unit_ids]:
+            counts[hex_obj.units.pop(unit_id).faction] -= 1
+        self._zoc_maps.clear()
+    
+    def _hex_has_enemy(self, hex_id, faction):
+        """Check whether any unit not of faction occupies a hex."""
+        counts = self.hex_faction_counts[self.hex_index[hex_id]]
+        return counts.sum() > counts[faction]
+    
+    def _scan_units(self):
+        """Refresh and return the columnar snapshot of units in play."""
+        return self._unit_scan.refresh(self.unit_table, self.hex_index)
+    
+    def get_turn_stats(self, turn_number):
+        """
+        Statistics recorded for a turn (see _new_turn_stats).
+        
+        Returns an empty record, without storing it, for turns with no
+        recorded events yet.
+        """
+        stats = self._turn_stats.get(turn_number)
+        return stats if stats is not None else _new_turn_stats()
+    
+    def faction_unit_arrays(self, faction: Faction):
+        """
+        Columnar view of every unit of a faction that has entered play.
+        
+        Args:
+            faction: Faction to select
+            
+        Returns:
+            Tuple (initial_strength, strength, alive) of aligned np.ndarrays;
+            alive is False for units already removed from the game
+        """
+        table = self.unit_table
+        rows = np.flatnonzero(table.faction[:len(table)] == faction)
+        return (table.initial_strength[rows].astype(np.int64), 
+                table.strength[rows].astype(np.int64), table.alive[rows])
+    
+    def force_totals(self):
+        """
+        Count the units in play and their combined strength, per faction.
+        
+        Returns:
+            Tuple (units, strength) of {Faction: int} dicts
+        """
+        table = self.unit_table
+        n = len(table)
+        alive = table.alive[:n]
+        faction = table.faction[:n][alive]
+        counts = np.bincount(faction, minlength=len(Faction))
+        strength = np.bincount(faction, weights=table.strength[:n][alive], 
+                               minlength=len(Faction))
+        return ({f: int(counts[f]) for f in Faction}, 
+                {f: int(strength[f]) for f in Faction})
+    
     def _setup_hex_grid(self):
         """Set up hex coordinate system and neighbor relationships."""
-        self.hex_coords = {}
-        
-        # Convert offset coordinates to axial coordinates
-        for hex_id in self.hexes:
-            col_char = hex_id[0]
-            row_num = int(hex_id[1:])
-            # "odd-q" vertical layout conversion
-            q = ord(col_char) - ord('A')
-            r = row_num - (q - (q & 1)) // 2
-            self.hex_coords[hex_id] = (q, r)
-        
+        # Dense integer index over hex IDs, in map order
+        self.hex_ids = list(self.hexes)
+        self.hex_index = {hex_id: i for i, hex_id in enumerate(self.hex_ids)}
+        # Hex objects by dense index
+        self.hex_list = list(self.hexes.values())
+        for i, hex_obj in enumerate(self.hex_list):
+            hex_obj.index = i
+        # Ocean hexes never hold ports, airfields or beaches, so per-turn
+        # sweeps for those only need to visit land
+        self.land_hexes = [h for h in self.hex_list if h.terrain_type != 'Ocean']
+        
+        # Convert offset coordinates to axial coordinates ("odd-q" vertical layout)
+        q = np.array([ord(hex_id[0]) - ord('A') for hex_id in self.hex_ids], dtype=np.int32)
+        row_num = np.array([int(hex_id[1:]) for hex_id in self.hex_ids], dtype=np.int32)
+        r = row_num - (q - (q & 1)) // 2
+        # (H, 2) axial coordinate array for bulk queries
+        self.hex_axial = np.stack([q, r], axis=1).reshape(-1, 2)
+        
+        self.hex_coords = dict(zip(self.hex_ids, map(tuple, self.hex_axial.tolist())))
+        # ROC draws supply from the eastern edge of the map (column J)
+        self._east_edge_mask = self.hex_axial[:, 0] >= 9
+        # Coastal flag per land hex, aligned with land_hexes
+        self._coastal_mask = np.array(
+            [hex_obj.terrain_type == 'Coastal' for hex_obj in self.land_hexes], 
+            dtype=bool)
         # Create reverse mapping for fast lookup
         self.coords_to_hex = {v: k for k, v in self.hex_coords.items()}
         
-        # Calculate neighbors for each hex
-        self.hex_neighbors = {hex_id: [] for hex_id in self.hexes}
-        axial_directions = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
-        
-        for hex_id, (q, r) in self.hex_coords.items():
-            for dq, dr in axial_directions:
-                neighbor_coords = (q + dq, r + dr)
-                if neighbor_coords in self.coords_to_hex:
-                    self.hex_neighbors[hex_id].append(self.coords_to_hex[neighbor_coords])
+        # Neighbor table (H, 6) of hex indices, -1 where off the map. Axial
+        # coordinates are scattered into a dense grid so all six directions
+        # are resolved with one broadcast lookup.
+        axial_directions = np.array([(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)], 
+                                    dtype=np.int32)
+        hex_count = len(self.hex_ids)
+        if hex_count:
+            origin = self.hex_axial.min(axis=0) - 1
+            grid_shape = tuple(self.hex_axial.max(axis=0) - origin + 2)
+            grid = np.full(grid_shape, -1, dtype=np.int32)
+            local = self.hex_axial - origin
+            grid[local[:, 0], local[:, 1]] = np.arange(hex_count, dtype=np.int32)
+            candidates = local[:, None, :] + axial_directions[None, :, :]
+            self.hex_neighbors_idx = grid[candidates[..., 0], candidates[..., 1]]
+        else:
+            self.hex_neighbors_idx = np.empty((0, 6), dtype=np.int32)
+        
+        # Neighbor index lists without the -1 slots, and the matching ID lists
+        # (in direction order) for the string-keyed callers
+        hex_ids = self.hex_ids
+        self._neighbor_lists = [[j for j in row if j >= 0] 
+                                for row in self.hex_neighbors_idx.tolist()]
+        self.hex_neighbors = {
+            hex_id: [hex_ids[j] for j in row]
+            for hex_id, row in zip(hex_ids, self._neighbor_lists)
+        }
+        # Neighbor Hex objects, for callers that need the hexes themselves
+        self._neighbor_hexes = {
+            hex_id: tuple(self.hex_list[j] for j in row)
+            for hex_id, row in zip(hex_ids, self._neighbor_lists)
+        }
+        self._move_cost_by_idx = [self._hex_move_cost[hex_id] for hex_id in hex_ids]
+        
+        # All-pairs (H, H) hex distance matrix, plus the hexes within artillery
+        # range of each hex (ascending index, i.e. map order)
+        dq = self.hex_axial[:, None, 0] - self.hex_axial[None, :, 0]
+        dr = self.hex_axial[:, None, 1] - self.hex_axial[None, :, 1]
+        self.hex_distance = (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+        self._arty_targets = [np.flatnonzero(row <= ARTILLERY_RANGE) 
+                              for row in self.hex_distance]
+        
+        # Units per (hex index, faction), kept in step with Hex.units by
+        # _place_unit / _remove_unit so presence checks skip the occupants
+        self.hex_faction_counts = np.zeros((len(self.hex_ids), len(Faction)), dtype=np.int32)
     
     def _get_neighbors(self, hex_id):
         """Get all neighboring hex IDs for a given hex."""
         return self.hex_neighbors.get(hex_id, [])
     
     def get_hex_distance(self, hex1_id, hex2_id):
-        """Calculate distance between two hexes using axial coordinates."""
-        if hex1_id not in self.hex_coords or hex2_id not in self.hex_coords:
+        """Look up the distance between two hexes (inf if either is off the map)."""
+        i = self.hex_index.get(hex1_id)
+        j = self.hex_index.get(hex2_id)
+        if i is None or j is None:
             return float('inf')
-        q1, r1 = self.hex_coords[hex1_id]
-        q2, r2 = self.hex_coords[hex2_id]
-        return (abs(q1 - q2) + abs(q1 + r1 - q2 - r2) + abs(r1 - r2)) / 2
+        return float(self.hex_distance[i, j])
+    
+    def bulk_hex_distance(self, src_idx, dst_idx):
+        """
+        Look up many hex distances in a single NumPy pass.
+        
+        Args:
+            src_idx: Array of source hex indices (see hex_index)
+            dst_idx: Index of one destination hex, or an array of destination
+                indices aligned with (or broadcastable against) src_idx
+            
+        Returns:
+            np.ndarray of integer hex distances, shaped like the broadcast of
+            src_idx and dst_idx
+        """
+        return self.hex_distance[src_idx, dst_idx]
     
     def run_simulation(self):
         """Main game loop."""
@@ -142,13 +489,11 @@ class SimulationEngine:
         
         while self.turn_number <= self.max_turns and not self.game_over:
             print(f"\n{'='*20} TURN {self.turn_number} {'='*20}")
+            self._state_cache.clear()
             
             # Reset unit action flags at start of turn
             for unit in self.units.values():
-                unit.has_moved = False
-                unit.has_attacked = False
-                unit.is_fortified = False
-                unit.is_supporting_arty = False
+                unit.reset_turn_flags()
             
             # Execute phases
             self._run_air_sea_phase()
@@ -163,15 +508,15 @@ class SimulationEngine:
                 self.turn_number += 1
         
         print("\n===== SIMULATION END =====")
-        if self.winner:
-            print(f"Winner: {self.winner.value}")
+        if self.winner is not None:
+            print(f"Winner: {self.winner.name}")
         elif self.game_over:
             print("Game Over: Stalemate or Max Turns Reached.")
         else:
             print(f"Max turns ({self.max_turns}) reached. Result: STALEMATE")
             self.game_over = True
             self.winner = Faction.ROC  # ROC wins by survival
-            print(f"Winner: {self.winner.value} (Survival)")
+            print(f"Winner: {self.winner.name} (Survival)")
     
     def _run_air_sea_phase(self):
         """Phase 1: Air & Sea Effects"""
@@ -179,7 +524,7 @@ class SimulationEngine:
         print(f"\n--- {self.current_phase.value} ---")
         
         # Rule 2.3.1: ROC interdiction
-        if random.random() < PLA_INTERDICTION_SUCCESS_RATE:
+        if self._rng.random() < PLA_INTERDICTION_SUCCESS_RATE:
             self.is_roc_interdicted = True
             print("  - PLA air interdiction successful. ROC movement penalized this turn.")
         else:
@@ -199,6 +544,9 @@ class SimulationEngine:
         """Phase 2: Supply Status Determination"""
         self.current_phase = Phase.SUPPLY_STATUS
         print(f"\n--- {self.current_phase.value} ---")
+        # Ownership, ZoC and the turn number may have changed since last turn
+        self._supplied.clear()
+        self._supply_sources.clear()
         
         for unit in self.units.values():
             if unit.location_hex_id:
@@ -216,181 +564,322 @@ class SimulationEngine:
         """Check if a unit is connected to a supply source."""
         if not unit.location_hex_id:
             return False
+        
+        supplied = self._supplied.get(unit.faction)
+        if supplied is None:
+            supplied = self._supplied[unit.faction] = self._compute_supply_map(unit.faction)
+        return bool(supplied[self.hex_index[unit.location_hex_id]])
+    
+    def _compute_supply_map(self, faction):
+        """
+        Find every hex from which a faction's units can trace supply.
+        
+        A unit is in supply if a supply source lies within MAX_SUPPLY_DISTANCE
+        hexes along a path that never enters enemy ZoC (the unit's own hex is
+        exempt). One multi-source BFS from the sources replaces a search per unit.
+        
+        Args:
+            faction: Faction to trace supply for
+            
+        Returns:
+            np.ndarray of bool, indexed by hex index
+        """
+        hex_ids = self.hex_ids
+        is_source = self._supply_source_mask(faction).tolist()
+        is_open = [not in_zoc for in_zoc in self._enemy_zoc_flags(faction)]
+        
+        # Hops from each ZoC-free hex to the nearest source through ZoC-free hexes
+        unreached = MAX_SUPPLY_DISTANCE + 1
+        dist = [unreached] * len(hex_ids)
+        q = collections.deque()
+        for i, (source, open_hex) in enumerate(zip(is_source, is_open)):
+            if source and open_hex:
+                dist[i] = 0
+                q.append(i)
+        
+        neighbors = self._neighbor_lists
+        while q:
+            i = q.popleft()
+            hops = dist[i] + 1
+            if hops > MAX_SUPPLY_DISTANCE:
+                continue
+            for j in neighbors[i]:
+                if is_open[j] and dist[j] > hops:
+                    dist[j] = hops
+                    q.append(j)
+        
+        # A unit steps into a ZoC-free neighbor first; off-map slots (-1) hit
+        # the trailing sentinel
+        padded = np.array(dist + [unreached], dtype=np.int32)
+        nearest = padded[self.hex_neighbors_idx].min(axis=1) if len(hex_ids) else padded[:0]
+        return np.array(is_source, dtype=bool) | (nearest + 1 <= MAX_SUPPLY_DISTANCE)
     
     def _run_player_action_phase(self, faction: Faction):
         """Phase 3: Player Action"""
         self.current_phase = Phase.PLAYER_ACTION
-        print(f"\n--- {self.current_phase.value} ({faction.value}) ---")
+        print(f"\n--- {self.current_phase.value} ({faction.name}) ---")
+        # Positions changed since the last phase; drop stale reachability maps
+        self._reach_cache.clear()
         
         agent = self.pla_agent if faction == Faction.PLA else self.roc_agent
         game_state = self._get_game_state(faction)
-        possible_actions = self._get_possible_actions(faction)
         
-        if not possible_actions or (len(possible_actions) == 1 and 
-                                   possible_actions[0]['action'] == ActionType.PASS.value):
-            print(f"  - No possible actions for {faction.value}. Passing turn.")
-            return
+        if agent.lazy_actions:
+            # The agent pulls actions per category itself; PASS comes last, so
+            # it is first only when there is nothing else to do
+            if next(self.iter_possible_actions(faction))['action'] == _PASS:
+                print(f"  - No possible actions for {faction.name}. Passing turn.")
+                return
+            possible_actions = functools.partial(self.iter_possible_actions, faction)
+        else:
+            possible_actions = self._get_possible_actions(faction)
+            if not possible_actions or (len(possible_actions) == 1 and 
+                                       possible_actions[0]['action'] == _PASS):
+                print(f"  - No possible actions for {faction.name}. Passing turn.")
+                return
         
-        chosen_actions = agent.choose_actions(
-            copy.deepcopy(game_state), 
-            copy.deepcopy(possible_actions)
-        )
+        # Both structures are built fresh for this phase (the game state is a
+        # read-only snapshot), so agents receive them without copying
+        chosen_actions = agent.choose_actions(game_state, possible_actions)
         
         if not chosen_actions or (len(chosen_actions) == 1 and 
-                                 chosen_actions[0]['action'] == ActionType.PASS.value):
-            print(f"  - {faction.value} chose to PASS.")
+                                 chosen_actions[0]['action'] == _PASS):
+            print(f"  - {faction.name} chose to PASS.")
             return
         
         # Execute chosen actions
         for action in chosen_actions:
-            print(f"  - {faction.value} executes: {action}")
-            if action['action'] == ActionType.MOVE.value:
-                self._execute_move(action)
-            elif action['action'] == ActionType.ATTACK.value:
-                self._declare_attack(action)
-            elif action['action'] == ActionType.FORTIFY.value:
-                self._execute_fortify(action)
-            elif action['action'] == ActionType.ARTILLERY_SUPPORT.value:
-                self._declare_artillery_support(action)
+            print(f"  - {faction.name} executes: {action}")
+            handler = self._action_handlers.get(action['action'])
+            if handler is not None:
+                handler(action)
+    
+    @staticmethod
+    def _unit_state_template(unit):
+        """Game-state unit entry with the fields fixed at creation filled in."""
+        return {
+            'unit_id': unit.unit_id,
+            'faction': unit.faction.value,
+            'unit_type': unit.unit_type.value,
+            'strength': None,
+            'location_hex_id': None,
+            'supply_status': None,
+            'turns_out_of_supply': None,
+            'is_reserve': unit.is_reserve,
+            'base_attack': unit.base_attack,
+            'base_defense': unit.base_defense,
+            'movement_points': unit.movement_points,
+            'has_moved': None,
+            'has_attacked': None,
+        }
     
     def _get_game_state(self, faction: Faction):
-        """Create game state dictionary for AI agents."""
+        """
+        Create game state dictionary for AI agents.
+        
+        Snapshots are cached per (turn, phase, faction), so repeated requests
+        within a phase (e.g. post-game summary and export) share one build.
+        Every build refills the shared unit_view in place, so only the latest
+        snapshot is kept cached: a snapshot's unit_view is valid until the
+        next snapshot is built. Callers must treat the returned dict as
+        read-only.
+        
+        Factions are given as Faction values (ints) throughout: unit
+        'faction', hex 'owner', 'current_player_faction' and the keys of
+        'player_specific_data'. Use Faction(value).name for display.
+        """
+        key = (self.turn_number, self.current_phase, faction)
+        cached = self._state_cache.get(key)
+        if cached is not None:
+            return cached
+        # Older snapshots share the unit_view refilled below
+        self._state_cache.clear()
+        
+        unit_templates = self._unit_state_templates
         unit_data = []
         for unit in self.units.values():
             if unit.strength > 0:
-                unit_data.append({
-                    'unit_id': unit.unit_id,
-                    'faction': unit.faction.value,
-                    'unit_type': unit.unit_type.value,
-                    'strength': unit.strength,
-                    'location_hex_id': unit.location_hex_id,
-                    'supply_status': unit.supply_status.value,
-                    'turns_out_of_supply': unit.turns_out_of_supply,
-                    'is_reserve': unit.is_reserve,
-                    'base_attack': unit.base_attack,
-                    'base_defense': unit.base_defense,
-                    'movement_points': unit.movement_points,
-                    'has_moved': unit.has_moved,
-                    'has_attacked': unit.has_attacked,
-                })
-        
-        map_data = {
-            hex_id: {
-                'name': h.name,
-                'terrain_type': h.terrain_type,
-                'owner': h.owner.value,
-                'is_victory_point': h.is_victory_point,
-                'port_status': h.port_status.value if h.port_status else None,
-                'airfield_status': h.airfield_status.value if h.airfield_status else None,
-                'unit_ids': [u.unit_id for u in h.units]
-            } for hex_id, h in self.hexes.items()
-        }
+                template = unit_templates.get(unit.unit_id)
+                if template is None:
+                    template = unit_templates[unit.unit_id] = self._unit_state_template(unit)
+                entry = template.copy()
+                entry['strength'] = unit.strength
+                entry['location_hex_id'] = unit.location_hex_id
+                entry['supply_status'] = unit.supply_status.value
+                entry['turns_out_of_supply'] = unit.turns_out_of_supply
+                entry['has_moved'] = unit.has_moved
+                entry['has_attacked'] = unit.has_attacked
+                unit_data.append(entry)
+        
+        hex_templates = self._hex_state_templates
+        map_data = {}
+        for hex_id, h in self.hexes.items():
+            entry = hex_templates[hex_id].copy()
+            entry['owner'] = h.owner.value
+            entry['port_status'] = h.port_status.value if h.port_status else None
+            entry['airfield_status'] = h.airfield_status.value if h.airfield_status else None
+            entry['unit_ids'] = list(h.units)
+            map_data[hex_id] = entry
         
         player_specific_data = {
-            'PLA': {
+            Faction.PLA: {
                 'amphibious_lift_capacity': self.pla_amphibious_lift_capacity,
                 'reinforcement_pool_count': len(self.pla_reinforcement_pool)
             },
-            'ROC': {}
+            Faction.ROC: {}
         }
         
-        return {
+        game_state = {
             'turn_number': self.turn_number,
             'current_phase': self.current_phase.value,
             'current_player_faction': faction.value,
             'map_data': map_data,
+            'key_location_ids': self._key_location_ids,
             'unit_data': unit_data,
+            'unit_view': self.unit_view.refresh(self.unit_table, self.hex_index),
             'player_specific_data': player_specific_data
         }
+        self._state_cache[key] = game_state
+        return game_state
     
     def _get_possible_actions(self, faction: Faction):
         """Generate all valid actions for a faction."""
-        actions = []
-        my_units = [u for u in self.units.values() 
-                   if u.faction == faction and u.strength > 0 and 
-                   not u.has_moved and not u.has_attacked]
-        
-        declared_attack_targets = set()
-        
-        for unit in my_units:
-            if not unit.location_hex_id:
-                continue
-            
-            # Generate movement actions
-            q = collections.deque([
-                (unit.location_hex_id, [unit.location_hex_id], unit.movement_points)
-            ])
-            visited_paths = {unit.location_hex_id}
+        return list(self.iter_possible_actions(faction))
+    
+    def iter_possible_actions(self, faction: Faction, kinds=None):
+        """
+        Lazily generate valid actions for a faction, one category at a time.
+        
+        Actions are yielded in category order (moves, attacks, artillery
+        support, fortify, pass), so a consumer that only needs the first few
+        actions of a category never pays for enumerating the rest.
+        
+        Args:
+            faction: Faction whose actions are generated
+            kinds: Optional collection of ActionType values to generate
+                (default: all action types)
             
-            while q:
-                current_hex, path, remaining_mp = q.popleft()
-                
-                # Add movement action if not starting hex
-                if path[-1] != unit.location_hex_id:
-                    actions.append({
-                        'action': ActionType.MOVE.value,
-                        'unit_id': unit.unit_id,
-                        'path': path
-                    })
-                
-                # Stop if entering enemy ZoC
-                if len(path) > 1 and self._is_in_enemy_zoc(current_hex, faction):
+        Yields:
+            Action dictionaries
+        """
+        def wanted(action_type):
+            return kinds is None or action_type.value in kinds
+        
+        scan = self._scan_units()
+        ready = np.flatnonzero((scan.faction == faction) & (scan.strength > 0) & 
+                               ~scan.has_moved & ~scan.has_attacked & 
+                               (scan.location_hex_idx >= 0))
+        my_units = [self.units[scan.unit_ids[i]] for i in ready.tolist()]
+        
+        # Generate movement actions
+        if wanted(ActionType.MOVE):
+            zoc_signature = self._zoc_signature(faction)
+            for unit in my_units:
+                start = unit.location_hex_id
+                reach = self._compute_reachability(
+                    start, unit.movement_points, faction, zoc_signature
+                )
+                for hex_id in reach:
+                    if hex_id != start:
+                        yield {
+                            'action': _MOVE,
+                            'unit_id': unit.unit_id,
+                            'path': self._reconstruct_path(reach, hex_id)
+                        }
+        
+        # Generate attack actions
+        if wanted(ActionType.ATTACK):
+            declared_attack_targets = set()
+            for unit in my_units:
+                if unit.unit_type in [UnitType.Artillery, UnitType.Engineer]:
                     continue
-                
-                # Explore neighbors
-                for neighbor in self._get_neighbors(current_hex):
-                    if neighbor not in visited_paths:
-                        terrain = self.hexes[neighbor].terrain_type
-                        terrain_mod = self.data['terrain_modifiers']
-                        cost_row = terrain_mod.loc[terrain_mod['terrain_type'] == terrain]
-                        cost_factor = cost_row['movement_cost_factor'].iloc[0] if not cost_row.empty else 1.0
-                        
-                        move_cost = 1.0 * cost_factor
-                        
-                        if remaining_mp >= move_cost:
-                            visited_paths.add(neighbor)
-                            q.append((neighbor, path + [neighbor], remaining_mp - move_cost))
-            
-            # Generate attack actions
-            if unit.unit_type not in [UnitType.Artillery, UnitType.Engineer]:
                 for neighbor_id in self._get_neighbors(unit.location_hex_id):
                     if neighbor_id in declared_attack_targets:
                         continue
-                    neighbor_hex = self.hexes[neighbor_id]
-                    if any(u.faction != faction for u in neighbor_hex.units):
+                    if self._hex_has_enemy(neighbor_id, faction):
                         attacking_units = [
-                            u.unit_id for u in self.hexes[unit.location_hex_id].units 
+                            u.unit_id for u in self.hexes[unit.location_hex_id].units.values() 
                             if u.faction == faction and not u.has_attacked
                         ]
                         if attacking_units:
-                            attack_action = {
-                                'action': ActionType.ATTACK.value,
+                            declared_attack_targets.add(neighbor_id)
+                            yield {
+                                'action': _ATTACK,
                                 'attacking_units': attacking_units,
                                 'target_hex': neighbor_id
                             }
-                            actions.append(attack_action)
-                            declared_attack_targets.add(neighbor_id)
-            
-            # Generate artillery support actions
-            if unit.unit_type == UnitType.Artillery:
-                for target_hex_id in self.hexes:
-                    if any(u.faction != faction for u in self.hexes[target_hex_id].units):
-                        if self.get_hex_distance(unit.location_hex_id, target_hex_id) <= ARTILLERY_RANGE:
-                            actions.append({
-                                'action': ActionType.ARTILLERY_SUPPORT.value,
-                                'unit_id': unit.unit_id,
-                                'target_hex': target_hex_id
-                            })
-            
-            # Generate fortify action
-            actions.append({
-                'action': ActionType.FORTIFY.value,
-                'unit_id': unit.unit_id
-            })
+        
+        # Generate artillery support actions
+        if wanted(ActionType.ARTILLERY_SUPPORT):
+            artillery = [u for u in my_units 
+                         if u.unit_type == UnitType.Artillery and u.location_hex_id in self.hex_index]
+            if artillery:
+                hex_ids = self.hex_ids
+                counts = self.hex_faction_counts
+                has_enemy = counts.sum(axis=1) > counts[:, faction]
+                for unit in artillery:
+                    targets = self._arty_targets[self.hex_index[unit.location_hex_id]]
+                    for i in targets[has_enemy[targets]].tolist():
+                        yield {
+                            'action': _ARTY,
+                            'unit_id': unit.unit_id,
+                            'target_hex': hex_ids[i]
+                        }
+        
+        # Generate fortify actions
+        if wanted(ActionType.FORTIFY):
+            for unit in my_units:
+                yield {
+                    'action': _FORTIFY,
+                    'unit_id': unit.unit_id
+                }
         
         # Always include pass option
-        actions.append({'action': ActionType.PASS.value})
-        return actions
+        if wanted(ActionType.PASS):
+            yield {'action': _PASS}
+    
+    def build_action_views(self, possible_actions):
+        """
+        Build a columnar (struct-of-arrays) view of a possible-actions list.
+        
+        Args:
+            possible_actions: List of action dicts from _get_possible_actions
+            
+        Returns:
+            Dictionary with aligned arrays, one entry per action:
+                action_type: np.int8 codes from ACTION_TYPE_CODES
+                unit_idx: np.int32 index into unit_ids (-1 if no unit_id)
+                end_hex_idx: np.int32 hex index of the path end (-1 if no path)
+            plus 'unit_ids' (list of unit IDs) and 'actions' (the original
+            list, for mapping rows back to action dicts).
+        """
+        n = len(possible_actions)
+        action_type = np.empty(n, dtype=np.int8)
+        unit_idx = np.full(n, -1, dtype=np.int32)
+        end_hex_idx = np.full(n, -1, dtype=np.int32)
+        unit_ids = []
+        unit_pos = {}
+        
+        for i, action in enumerate(possible_actions):
+            action_type[i] = ACTION_TYPE_CODES[action['action']]
+            unit_id = action.get('unit_id')
+            if unit_id is not None:
+                pos = unit_pos.get(unit_id)
+                if pos is None:
+                    pos = unit_pos[unit_id] = len(unit_ids)
+                    unit_ids.append(unit_id)
+                unit_idx[i] = pos
+            path = action.get('path')
+            if path:
+                end_hex_idx[i] = self.hex_index[path[-1]]
+        
+        return {
+            'action_type': action_type,
+            'unit_idx': unit_idx,
+            'end_hex_idx': end_hex_idx,
+            'unit_ids': unit_ids,
+            'actions': possible_actions
+        }
     
     def _execute_move(self, action):
         """Execute a unit movement action."""
@@ -403,9 +892,9 @@ class SimulationEngine:
         end_hex_id = path[-1]
         
         # Ensure unit is in the start hex
-        if unit in self.hexes[start_hex_id].units:
-            self.hexes[start_hex_id].units.remove(unit)
-            self.hexes[end_hex_id].units.append(unit)
+        if unit.unit_id in self.hexes[start_hex_id].units:
+            self._remove_unit(unit, self.hexes[start_hex_id])
+            self._place_unit(unit, self.hexes[end_hex_id])
             unit.location_hex_id = end_hex_id
             unit.has_moved = True
             print(f"  - Unit {unit.unit_id} moved from {start_hex_id} to {end_hex_id}.")
@@ -448,62 +937,115 @@ class SimulationEngine:
             print("  - No combats to resolve.")
             return
         
-        for combat in self.pending_combats:
-            self._resolve_combat(combat)
+        # One d20 per declared combat, drawn in a single batch
+        d20_rolls = self._rng.integers(1, D20_SIDES + 1, size=len(self.pending_combats))
+        for combat, d20_roll in zip(self.pending_combats, d20_rolls.tolist()):
+            self._resolve_combat(combat, d20_roll)
         
         self.pending_combats = []
     
-    def _resolve_combat(self, combat_declaration):
-        """Resolve a single combat."""
+    def _resolve_combat(self, combat_declaration, d20_roll=None):
+        """
+        Resolve a single combat.
+        
+        Args:
+            combat_declaration: Declared attack (attacking_units, target_hex)
+            d20_roll: Pre-drawn d20 result (default: roll one now)
+        """
         attackers = [self.units[uid] for uid in combat_declaration['attacking_units'] 
                     if uid in self.units]
         if not attackers:
             return
         
         target_hex = self.hexes[combat_declaration['target_hex']]
-        defenders = [u for u in target_hex.units if u.faction != attackers[0].faction]
+        defenders = [u for u in target_hex.units.values() if u.faction != attackers[0].faction]
         
         if not defenders:
             print(f"  - Combat at {target_hex.hex_id} cancelled: No defenders.")
             # Capture hex
+            if target_hex.owner != attackers[0].faction:
+                self._turn_stats[self.turn_number]['hexes_captured'] += 1
             target_hex.owner = attackers[0].faction
-            print(f"  - Hex {target_hex.hex_id} captured by {target_hex.owner.value}.")
+            print(f"  - Hex {target_hex.hex_id} captured by {target_hex.owner.name}.")
             return
         
         print(f"\n  Combat at {target_hex.hex_id}: "
               f"{[u.unit_id for u in attackers]} vs {[u.unit_id for u in defenders]}")
         
+        if d20_roll is None:
+            d20_roll = int(self._rng.integers(1, D20_SIDES + 1))
+        outcome = self._compute_combat(attackers, defenders, target_hex, d20_roll)
+        
+        for line in outcome['modifiers']:
+            print(f"    {line}")
+        print(f"    Final odds: {outcome['odds_ratio']:.2f}:1 "
+              f"({outcome['attack_power']:.1f} vs {outcome['defense_power']:.1f})")
+        print(f"    CRT Column: {outcome['crt_column']}, d20 roll: {d20_roll}")
+        
+        result = outcome['result']
+        if result is None:
+            print("    ERROR: CRT lookup failed")
+            return
+        print(f"    Result: {_format_crt_result(result)}")
+        
+        # Apply results
+        strength_before = [u.strength for u in attackers + defenders]
+        self._apply_combat_result(result, attackers, defenders, target_hex)
+        # Losses may have stripped units of their ZoC
+        self._zoc_maps.clear()
+        
+        stats = self._turn_stats[self.turn_number]
+        stats['combats'] += 1
+        for unit, before in zip(attackers + defenders, strength_before):
+            stats['strength_lost'][unit.faction] += before - unit.strength
+    
+    def _compute_combat(self, attackers, defenders, target_hex, d20_roll):
+        """
+        Work out a combat's odds and CRT result without changing any state.
+        
+        Args:
+            attackers: Attacking Unit objects
+            defenders: Defending Unit objects
+            target_hex: Hex being attacked
+            d20_roll: d20 result to look up
+            
+        Returns:
+            Dict with attack_power, defense_power, odds_ratio, crt_column,
+            result (the parsed (attacker_loss, defender_loss, special) cell,
+            or None if the CRT has no row for the roll) and modifiers, the
+            applied modifier descriptions in order
+        """
+        modifiers = []
+        
         # 1. Calculate modified combat power
-        total_attack_power = sum(u.get_current_attack() for u in attackers)
-        total_defense_power = sum(u.get_current_defense() for u in defenders)
+        table = self.unit_table
+        total_attack_power = table.attack_power(table.rows_of(attackers))
+        total_defense_power = table.defense_power(table.rows_of(defenders))
         
         # 2. Apply modifiers
         # Terrain modifier
-        terrain_mod = target_hex.get_defense_modifier(self.data['terrain_modifiers'])
+        terrain_mod = target_hex.get_defense_modifier()
         total_defense_power *= terrain_mod
-        print(f"    Terrain modifier: x{terrain_mod}")
+        modifiers.append(f"Terrain modifier: x{terrain_mod}")
         
         # Fortification bonus
-        fortified_defenders = [d for d in defenders if d.is_fortified]
-        if fortified_defenders:
+        if any(d.is_fortified for d in defenders):
             total_defense_power *= 1.5
-            print(f"    Fortification bonus applied")
+            modifiers.append("Fortification bonus applied")
         
         # CAS bonus
         if attackers[0].faction == Faction.PLA and self.pla_cas_available:
             total_attack_power *= 1.2
-            print(f"    PLA CAS bonus applied")
+            modifiers.append("PLA CAS bonus applied")
         
         # Out of supply penalty
-        oos_attackers = [a for a in attackers if a.supply_status == SupplyStatus.Out_Of_Supply]
-        if oos_attackers:
+        if any(a.supply_status == SupplyStatus.Out_Of_Supply for a in attackers):
             total_attack_power *= 0.5
-            print(f"    Attackers out of supply penalty")
+            modifiers.append("Attackers out of supply penalty")
         
-        oos_defenders = [d for d in defenders if d.supply_status == SupplyStatus.Out_Of_Supply]
-        if oos_defenders:
+        if any(d.supply_status == SupplyStatus.Out_Of_Supply for d in defenders):
             total_defense_power *= 0.5
-            print(f"    Defenders out of supply penalty")
+            modifiers.append("Defenders out of supply penalty")
         
         # 3. Calculate odds ratio
         if total_defense_power > 0:
@@ -511,70 +1053,40 @@ class SimulationEngine:
         else:
             odds_ratio = 99.0
         
-        print(f"    Final odds: {odds_ratio:.2f}:1 ({total_attack_power:.1f} vs {total_defense_power:.1f})")
-        
         # 4. Map to CRT column
-        if odds_ratio < 0.75:
-            crt_column = '1:2'
-        elif odds_ratio < 1.5:
-            crt_column = '1:1'
-        elif odds_ratio < 2.5:
-            crt_column = '2:1'
-        elif odds_ratio < 3.5:
-            crt_column = '3:1'
-        else:
-            crt_column = '4:1+'
-        
-        # 5. Roll d20
-        d20_roll = random.randint(1, D20_SIDES)
-        print(f"    CRT Column: {crt_column}, d20 roll: {d20_roll}")
-        
-        # 6. Look up result in CRT
-        crt = self.data['combat_results_table']
-        result_row = None
-        if d20_roll <= 5:
-            result_row = crt[crt['d20_Roll'] == '1-5']
-        elif d20_roll <= 10:
-            result_row = crt[crt['d20_Roll'] == '6-10']
-        elif d20_roll <= 15:
-            result_row = crt[crt['d20_Roll'] == '11-15']
-        elif d20_roll <= 19:
-            result_row = crt[crt['d20_Roll'] == '16-19']
-        else:
-            result_row = crt[crt['d20_Roll'] == '20']
+        column_index = _crt_odds_index(odds_ratio)
         
-        if result_row.empty:
-            print("    ERROR: CRT lookup failed")
-            return
+        # 5. Look up result in CRT
+        crt = self._crt_fast
+        result_row = crt[d20_roll] if 0 < d20_roll < len(crt) else None
         
-        result = result_row[crt_column].iloc[0]
-        print(f"    Result: {result}")
-        
-        # 7. Apply results
-        self._apply_combat_result(result, attackers, defenders, target_hex)
+        return {
+            'attack_power': total_attack_power,
+            'defense_power': total_defense_power,
+            'odds_ratio': odds_ratio,
+            'crt_column': _CRT_COLUMNS[column_index],
+            'result': result_row[column_index] if result_row is not None else None,
+            'modifiers': modifiers,
+        }
     
     def _apply_combat_result(self, result, attackers, defenders, target_hex):
-        """Apply combat result from CRT."""
-        # Parse result string
-        match = re.match(r'A-(\d+)/D-(\d+)(?:_(\w+))?', result)
-        if not match:
-            print(f"    ERROR: Invalid result format: {result}")
-            return
+        """
+        Apply combat result from CRT.
         
-        attacker_loss = int(match.group(1))
-        defender_loss = int(match.group(2))
-        special = match.group(3) if match.group(3) else None
+        Args:
+            result: Parsed CRT cell (attacker_loss, defender_loss, special),
+                as stored in crt_fast
+        """
+        attacker_loss, defender_loss, special = result
         
         # Apply losses
         if attacker_loss > 0:
             print(f"    Attackers take {attacker_loss}% losses")
-            for unit in attackers:
-                unit.take_damage(attacker_loss)
+            self.unit_table.take_damage(attackers, attacker_loss)
         
         if defender_loss > 0:
             print(f"    Defenders take {defender_loss}% losses")
-            for unit in defenders:
-                unit.take_damage(defender_loss)
+            self.unit_table.take_damage(defenders, defender_loss)
         
         # Handle special results
         units_to_retreat = []
@@ -591,36 +1103,36 @@ class SimulationEngine:
         elif special == 'DX':  # Defender eliminated
             print("    Defenders eliminated!")
             for unit in defenders:
-                unit.strength = 0
+                unit.eliminate()
         elif special == 'AX':  # Attacker eliminated
             print("    Attackers eliminated!")
             for unit in attackers:
-                unit.strength = 0
+                unit.eliminate()
         
         # Check for hex capture
         surviving_defenders = [d for d in defenders if d.strength > 0 and d not in units_to_retreat]
         if not surviving_defenders and target_hex.owner != attackers[0].faction:
+            self._turn_stats[self.turn_number]['hexes_captured'] += 1
             target_hex.owner = attackers[0].faction
-            print(f"    Hex {target_hex.hex_id} captured by {target_hex.owner.value}!")
+            print(f"    Hex {target_hex.hex_id} captured by {target_hex.owner.name}!")
     
     def _retreat_units(self, units, from_hex, faction):
         """Handle unit retreat."""
-        # Find valid retreat hexes
-        valid_retreats = []
-        for neighbor_id in self._get_neighbors(from_hex.hex_id):
-            neighbor = self.hexes[neighbor_id]
-            # Can't retreat into enemy units or enemy ZoC
-            if not any(u.faction != faction for u in neighbor.units):
-                if not self._is_in_enemy_zoc(neighbor_id, faction):
-                    valid_retreats.append(neighbor)
+        # The combat's losses were just applied
+        self._zoc_maps.clear()
+        
+        # Find valid retreat hexes (can't retreat into enemy units or enemy ZoC)
+        valid_retreats = [
+            neighbor for neighbor in self._neighbor_hexes[from_hex.hex_id]
+            if not self._hex_has_enemy(neighbor.hex_id, faction) and 
+            not self._is_in_enemy_zoc(neighbor.hex_id, faction)
+        ]
         
         if valid_retreats:
             # Retreat to random valid hex
-            retreat_hex = random.choice(valid_retreats)
+            retreat_hex = valid_retreats[self._rng.integers(len(valid_retreats))]
+            self._relocate_units(units, from_hex, retreat_hex)
             for unit in units:
-                from_hex.units.remove(unit)
-                retreat_hex.units.append(unit)
-                unit.location_hex_id = retreat_hex.hex_id
                 print(f"      {unit.unit_id} retreats to {retreat_hex.hex_id}")
         else:
             # No valid retreat - units take additional damage
@@ -636,7 +1148,7 @@ class SimulationEngine:
         lift_for_reinforce = self.pla_amphibious_lift_capacity
         
         # Find available landing zones
-        landing_zones = [h for h in self.hexes.values() 
+        landing_zones = [h for h in self.land_hexes 
                         if h.terrain_type == 'Coastal' and h.owner == Faction.PLA]
         
         if not landing_zones:
@@ -657,7 +1169,8 @@ class SimulationEngine:
                 landing_zone = min(landing_zones, key=lambda h: len(h.units))
                 unit_to_land.location_hex_id = landing_zone.hex_id
                 self.units[unit_to_land.unit_id] = unit_to_land
-                landing_zone.units.append(unit_to_land)
+                self._track_unit(unit_to_land)
+                self._place_unit(unit_to_land, landing_zone)
                 
                 print(f"  - PLA reinforces with {unit_to_land.unit_id} at {landing_zone.hex_id}. "
                       f"Remaining lift: {lift_for_reinforce}")
@@ -671,14 +1184,24 @@ class SimulationEngine:
         print(f"\n--- {self.current_phase.value} ---")
         
         # Remove destroyed units
-        destroyed_units = [uid for uid, u in self.units.items() if u.strength <= 0]
+        stats = self._turn_stats[self.turn_number]
+        table = self.unit_table
+        destroyed_units = [table.units[i].unit_id for i in table.destroyed_rows().tolist()]
+        # Clear each affected hex in one pass
+        dead = set(destroyed_units)
+        touched_hexes = {self.units[uid].location_hex_id for uid in destroyed_units}
+        touched_hexes.discard(None)
+        for hex_id in touched_hexes:
+            self._purge_units(self.hexes[hex_id], dead)
         for uid in destroyed_units:
-            unit = self.units[uid]
-            if unit.location_hex_id and unit in self.hexes[unit.location_hex_id].units:
-                self.hexes[unit.location_hex_id].units.remove(unit)
-            del self.units[uid]
+            unit = self.units.pop(uid)
+            self._untrack_unit(unit)
+            stats['destroyed'][unit.faction] += 1
             print(f"  - Unit {uid} (strength 0) removed from game.")
         
+        # Record end-of-turn force totals for turn summaries
+        stats['units'], stats['strength'] = self.force_totals()
+        
         # Victory condition check
         taipei_hex = self.hexes['A10']
         if taipei_hex.owner == Faction.PLA:
@@ -687,74 +1210,118 @@ class SimulationEngine:
             print("  - VICTORY CHECK: PLA has captured Taipei!")
         
         # Check if PLA has any units left
-        pla_units = [u for u in self.units.values() if u.faction == Faction.PLA]
-        if not pla_units and not self.pla_reinforcement_pool:
+        if not self._units_by_faction[Faction.PLA] and not self.pla_reinforcement_pool:
             self.game_over = True
             self.winner = Faction.ROC
             print("  - VICTORY CHECK: All PLA forces eliminated!")
-        
-        # BFS to find supply path
-        q = collections.deque([(unit.location_hex_id, [unit.location_hex_id])])
-        visited = {unit.location_hex_id}
-        
-        while q:
-            current_hex_id, path = q.popleft()
-            
-            # Check if this is a supply source
-            if self._is_supply_source(current_hex_id, unit.faction):
-                return True
-            
-            # Path length limit
-            if len(path) > MAX_SUPPLY_DISTANCE:
-                continue
-            
-            # Explore neighbors
-            for neighbor_id in self._get_neighbors(current_hex_id):
-                if neighbor_id not in visited:
-                    # Check if path is blocked by enemy ZoC
-                    if not self._is_in_enemy_zoc(neighbor_id, unit.faction):
-                        visited.add(neighbor_id)
-                        q.append((neighbor_id, path + [neighbor_id]))
-        
-        return False
     
-    def _is_supply_source(self, hex_id, faction):
-        """Check if a hex is a supply source for a faction."""
-        hex_obj = self.hexes[hex_id]
+    def _supply_source_mask(self, faction):
+        """
+        Flag every supply source hex of a faction, by hex index.
+        
+        Sources depend on ownership, facility status and the turn number, so
+        the masks are built once per supply phase and reused until the next.
+        """
+        mask = self._supply_sources.get(faction)
+        if mask is not None:
+            return mask
         
         if faction == Faction.ROC:
             # Eastern edge of map (column J)
-            q, _ = self.hex_coords[hex_id]
-            return q >= 9
-        
+            mask = self._east_edge_mask
         elif faction == Faction.PLA:
-            # PLA-controlled operational ports/airfields
-            if hex_obj.owner == Faction.PLA:
-                if hex_obj.is_port and hex_obj.port_status == PortStatus.Operational:
-                    return True
-                if hex_obj.is_airfield and hex_obj.airfield_status == AirfieldStatus.Operational:
-                    return True
+            beachheads = self.turn_number <= 3
+            sources = []
+            for h, coastal in zip(self.land_hexes, self._coastal_mask.tolist()):
+                # Only PLA-controlled hexes can be PLA sources
+                if h.owner != Faction.PLA:
+                    continue
+                # Operational ports/airfields, or a coastal beachhead in the first 3 turns
+                if ((h.is_port and h.port_status is PortStatus.Operational) or 
+                        (h.is_airfield and h.airfield_status is AirfieldStatus.Operational) or 
+                        (beachheads and coastal)):
+                    sources.append(h.index)
+            mask = np.zeros(len(self.hex_ids), dtype=bool)
+            mask[sources] = True
+        else:
+            mask = np.zeros(len(self.hex_ids), dtype=bool)
+        
+        self._supply_sources[faction] = mask
+        return mask
+    
+    def _zoc_signature(self, friendly_faction):
+        """Return the hexes holding enemy units that project ZoC."""
+        return frozenset(
+            unit.location_hex_id for unit in self.units.values()
+            if (unit.strength > 0 and 
+                unit.faction != friendly_faction and 
+                unit.unit_type in _ZOC_PROJECTING)
+        )
+    
+    def _compute_reachability(self, start, movement_points, faction, zoc_signature):
+        """
+        Breadth-first reachability map for a unit, cached across units.
+        
+        Args:
+            start: Hex ID the unit starts from
+            movement_points: Movement points available
+            faction: Moving faction (for enemy ZoC)
+            zoc_signature: Result of _zoc_signature for the current positions
             
-            # Coastal beachhead in first 3 turns
-            if (self.turn_number <= 3 and 
-                hex_obj.terrain_type == 'Coastal' and 
-                hex_obj.owner == Faction.PLA):
-                return True
+        Returns:
+            Dict mapping each reachable hex ID to (remaining_mp, parent_hex_id),
+            in BFS discovery order
+        """
+        key = (start, movement_points, faction, zoc_signature)
+        reach = self._reach_cache.get(key)
+        if reach is not None:
+            return reach
+        
+        order, remaining_mp, parent = _reachability_kernel(
+            self.hex_index[start], movement_points, self._neighbor_lists, 
+            self._move_cost_by_idx, self._enemy_zoc_flags(faction)
+        )
+        hex_ids = self.hex_ids
+        reach = {
+            hex_ids[i]: (mp, hex_ids[p] if p >= 0 else None)
+            for i, mp, p in zip(order, remaining_mp, parent)
+        }
         
-        return False
+        self._reach_cache[key] = reach
+        return reach
+    
+    @staticmethod
+    def _reconstruct_path(reach, hex_id):
+        """Walk parent links of a reachability map back to the start hex."""
+        path = []
+        while hex_id is not None:
+            path.append(hex_id)
+            hex_id = reach[hex_id][1]
+        path.reverse()
+        return path
     
     def _is_in_enemy_zoc(self, hex_id, friendly_faction):
         """Check if a hex is in enemy Zone of Control."""
-        enemy_faction = Faction.ROC if friendly_faction == Faction.PLA else Faction.PLA
-        
-        for neighbor_id in self._get_neighbors(hex_id):
-            neighbor_hex = self.hexes.get(neighbor_id)
-            if neighbor_hex:
-                for unit in neighbor_hex.units:
-                    # Only certain unit types project ZoC
-                    if (unit.faction == enemy_faction and 
-                        unit.strength > 0 and 
-                        unit.unit_type in [UnitType.Armor, UnitType.Mechanized, UnitType.Infantry]):
-                        return True
-        
-        return False
\ No newline at end of file
+        idx = self.hex_index.get(hex_id)
+        return idx is not None and self._enemy_zoc_flags(friendly_faction)[idx]
+    
+    def _enemy_zoc_flags(self, friendly_faction):
+        """
+        Flag every hex adjacent to an enemy ZoC-projecting unit.
+        
+        Args:
+            friendly_faction: Faction whose enemies' ZoC is wanted
+            
+        Returns:
+            List of bool indexed by hex index (cached until units move or
+            take losses)
+        """
+        flags = self._zoc_maps.get(friendly_faction)
+        if flags is None:
+            # Trailing slot stays False so off-map neighbors (-1) never count
+            occupied = np.zeros(len(self.hex_ids) + 1, dtype=bool)
+            for hex_id in self._zoc_signature(friendly_faction):
+                occupied[self.hex_index[hex_id]] = True
+            flags = occupied[self.hex_neighbors_idx].any(axis=1).tolist()
+            self._zoc_maps[friendly_faction] = flags
+        return flags
\ No newline at end of file
@@ -8,13 +8,18 @@ Enumeration definitions for T-GCSM v2.0
 Provides type safety and clarity for various game states and properties.
 """
 
-from enum import Enum
-
-
-class Faction(Enum):
-    """Represents the two main factions in the simulation."""
-    PLA = "PLA"  # People's Liberation Army (China)
-    ROC = "ROC"  # Republic of China (Taiwan)
+from enum import Enum, IntEnum
+
+
+class Faction(IntEnum):
+    """
+    Represents the two main factions in the simulation.
+    
+    Integer-valued so faction checks in hot loops are plain int compares;
+    use .name ("PLA"/"ROC") for display and Faction[name] to parse.
+    """
+    PLA = 0  # People's Liberation Army (China)
+    ROC = 1  # Republic of China (Taiwan)
 
 
 class UnitType(Enum):
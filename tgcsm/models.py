@@ -5,11 +5,38 @@
 
 """
 Core data model classes for T-GCSM v2.0
-Includes Hex and Unit classes representing the game board and military units.
+Includes Hex and Unit classes representing the game board and military units,
+and UnitView, a columnar snapshot of unit state for AI agents.
 """
 
+import sys
+import numpy as np
+from .config import VERBOSE_COMBAT
 from .enums import Faction, UnitType, SupplyStatus, PortStatus, AirfieldStatus
 
+# Unit ID prefix -> owning faction; IDs without a known prefix belong to ROC
+_FACTION_BY_PREFIX = {'PLA': Faction.PLA, 'ROC': Faction.ROC}
+
+# Fallback (attack, defense) for units whose template yields no equipment
+_DEFAULT_COMBAT = {
+    UnitType.Armor: (15, 12),
+    UnitType.Mechanized: (10, 10),
+    UnitType.Infantry: (8, 12),
+    UnitType.Artillery: (4, 4),
+    UnitType.Engineer: (4, 6),
+    UnitType.AttackHelo: (12, 2)
+}
+
+# Movement points per turn by unit type
+_MOVEMENT_POINTS = {
+    UnitType.Armor: 6,
+    UnitType.Mechanized: 8,
+    UnitType.Infantry: 4,
+    UnitType.Artillery: 4,
+    UnitType.Engineer: 4,
+    UnitType.AttackHelo: 12
+}
+
 
 class Hex:
     """
@@ -27,12 +54,27 @@ class Hex:
         owner (Faction): Current controlling faction
         port_status (PortStatus): Operational status of port
         airfield_status (AirfieldStatus): Operational status of airfield
-        units (list): List of Unit objects currently in this hex
+        units (dict): Unit objects currently in this hex, keyed by unit ID
+            (insertion-ordered, so iteration follows arrival order)
+        index (int): Dense hex index assigned by the engine at map setup
+            (-1 until then)
     """
     
-    def __init__(self, hex_data):
-        """Initialize a Hex from a data row."""
-        self.hex_id = hex_data['hex_id']
+    __slots__ = ('hex_id', 'name', 'terrain_type', 'is_port', 'port_name', 
+                 'is_airfield', 'airfield_name', 'is_victory_point', 'owner', 
+                 'port_status', 'airfield_status', 'units', '_defense_mult', 
+                 '_move_cost', 'index')
+    
+    def __init__(self, hex_data, terrain_table):
+        """
+        Initialize a Hex from a data row.
+        
+        terrain_table maps terrain_type -> (defense_multiplier,
+        movement_cost_factor). This hex's modifiers are read from it once,
+        here, since a hex's terrain never changes; unknown terrain gets 1.0.
+        """
+        # Interned so ID compares in dict lookups reduce to an identity check
+        self.hex_id = sys.intern(hex_data['hex_id'])
         self.name = hex_data['name']
         self.terrain_type = hex_data['terrain_type']
         self.is_port = bool(hex_data['is_port'])
@@ -40,27 +82,24 @@ class Hex:
         self.is_airfield = bool(hex_data['is_airfield'])
         self.airfield_name = hex_data['airfield_name']
         self.is_victory_point = bool(hex_data['is_victory_point'])
-        self.owner = Faction(hex_data['initial_owner'])
+        self.owner = Faction[hex_data['initial_owner']]
         self.port_status = PortStatus.Operational if self.is_port else None
         self.airfield_status = AirfieldStatus.Operational if self.is_airfield else None
-        self.units = []  # List of Unit objects in this hex
+        self.units = {}  # unit_id -> Unit for units in this hex
+        self.index = -1
+        self._defense_mult, self._move_cost = terrain_table.get(
+            self.terrain_type, (1.0, 1.0))
 
     def __repr__(self):
-        return f"Hex({self.hex_id}: {self.name}, {self.terrain_type}, Owner: {self.owner.value})"
+        return f"Hex({self.hex_id}: {self.name}, {self.terrain_type}, Owner: {self.owner.name})"
 
-    def get_defense_modifier(self, terrain_modifiers_df):
+    def get_defense_modifier(self):
         """Get the defense multiplier for this hex's terrain type."""
-        terrain_row = terrain_modifiers_df[terrain_modifiers_df['terrain_type'] == self.terrain_type]
-        if not terrain_row.empty:
-            return terrain_row['defense_multiplier'].iloc[0]
-        return 1.0
+        return self._defense_mult
 
-    def get_movement_cost(self, terrain_modifiers_df):
+    def get_movement_cost(self):
         """Get the movement cost factor for this hex's terrain type."""
-        terrain_row = terrain_modifiers_df[terrain_modifiers_df['terrain_type'] == self.terrain_type]
-        if not terrain_row.empty:
-            return terrain_row['movement_cost_factor'].iloc[0]
-        return 1.0
+        return self._move_cost
 
 
 class Unit:
@@ -73,7 +112,9 @@ class Unit:
         unit_type (UnitType): Type of unit (Armor, Infantry, etc.)
         is_reserve (bool): Whether this is a reserve unit
         location_hex_id (str): Current hex location
-        strength (int): Current strength (0-100)
+        strength (int): Current strength (0-100); change it through
+            take_damage or eliminate so the cached strength ratio and the
+            unit's UnitTable row follow
         initial_strength (int): Starting strength
         supply_status (SupplyStatus): Current supply status
         turns_out_of_supply (int): Number of turns without supply
@@ -87,31 +128,45 @@ class Unit:
         is_supporting_arty (bool): Whether artillery is providing support
     """
     
-    def __init__(self, unit_id, unit_data, battalion_templates, equipment_catalog):
-        """Initialize a Unit from data rows."""
+    __slots__ = ('unit_id', 'faction', 'unit_type', 'is_reserve', 'location_hex_id', 
+                 'strength', 'initial_strength', 'supply_status', 'turns_out_of_supply', 
+                 'base_attack', 'base_defense', 'movement_points', 'lift_cost', 
+                 'has_moved', 'has_attacked', 'is_fortified', 'is_supporting_arty', 
+                 '_table', '_row')
+    
+    def __init__(self, unit_id, unit_data, battalion_templates, equipment_catalog,
+                 template_stats=None):
+        """
+        Initialize a Unit from data rows.
+        
+        Args:
+            template_stats (dict): Optional table from build_template_stats;
+                built from the two data frames when not given
+        """
         self.unit_id = unit_id
-        self.faction = Faction(unit_data['brigade'].split()[0] if 'PLA' in unit_id else 'ROC')
+        self.faction = _FACTION_BY_PREFIX.get(unit_id[:3], Faction.ROC)
         
-        # Get template data
-        template_id = unit_data['template_id']
-        template_rows = battalion_templates[battalion_templates['template_id'] == template_id]
+        if template_stats is None:
+            template_stats = Unit.build_template_stats(battalion_templates, equipment_catalog)
         
-        if not template_rows.empty:
-            template = template_rows.iloc[0]
-            self.unit_type = UnitType(template['unit_type'])
-        else:
-            # Default for units without templates
-            self.unit_type = UnitType.Infantry
+        # Get template data; units without templates default to infantry
+        self.unit_type, combat_values = template_stats.get(
+            unit_data['template_id'], (UnitType.Infantry, None))
         
         self.is_reserve = bool(unit_data['is_reserve'])
-        self.location_hex_id = unit_data['location_hex_id'] if unit_data['location_hex_id'] else None
+        location = unit_data['location_hex_id']
+        if isinstance(location, str):
+            location = sys.intern(location)
+        self.location_hex_id = location if location else None
         self.strength = int(unit_data['initial_strength'])
         self.initial_strength = self.strength
         self.supply_status = SupplyStatus.In_Supply
         self.turns_out_of_supply = 0
         
-        # Calculate combat values based on unit type and equipment
-        self._calculate_combat_values(template_rows, equipment_catalog)
+        # Combat values come pre-aggregated from the template's equipment
+        if combat_values is None:
+            combat_values = _DEFAULT_COMBAT.get(self.unit_type, (8, 8))
+        self.base_attack, self.base_defense = combat_values
         
         # Set movement points based on unit type
         self._set_movement_points()
@@ -124,104 +179,106 @@ class Unit:
         self.has_attacked = False
         self.is_fortified = False
         self.is_supporting_arty = False
+        
+        # Row in the engine's UnitTable, set once the unit enters play
+        self._table = None
+        self._row = -1
 
-    def _calculate_combat_values(self, template_rows, equipment_catalog):
-        """Calculate attack and defense values based on equipment."""
-        if template_rows.empty or equipment_catalog.empty:
-            # Default values by unit type
-            default_values = {
-                UnitType.Armor: (15, 12),
-                UnitType.Mechanized: (10, 10),
-                UnitType.Infantry: (8, 12),
-                UnitType.Artillery: (4, 4),
-                UnitType.Engineer: (4, 6),
-                UnitType.AttackHelo: (12, 2)
-            }
-            self.base_attack, self.base_defense = default_values.get(self.unit_type, (8, 8))
-            return
-        
-        total_attack = 0
-        total_defense = 0
-        total_equipment = 0
-        
-        for _, row in template_rows.iterrows():
-            equipment_id = row['equipment_id']
-            quantity = row['quantity'] if 'quantity' in row and row['quantity'] > 0 else 0
-            
-            if equipment_id and quantity > 0:
-                equipment_rows = equipment_catalog[equipment_catalog['equipment_id'] == equipment_id]
-                if not equipment_rows.empty:
-                    equipment = equipment_rows.iloc[0]
-                    # Simplified combat value calculation
-                    attack_value = self._calculate_equipment_attack(equipment)
-                    defense_value = self._calculate_equipment_defense(equipment)
-                    total_attack += attack_value * quantity
-                    total_defense += defense_value * quantity
-                    total_equipment += quantity
-        
-        if total_equipment > 0:
-            # Normalize by equipment count and apply unit type modifiers
-            self.base_attack = int(total_attack / total_equipment)
-            self.base_defense = int(total_defense / total_equipment)
-        else:
-            # Use default values for unit type
-            default_values = {
-                UnitType.Armor: (15, 12),
-                UnitType.Mechanized: (10, 10),
-                UnitType.Infantry: (8, 12),
-                UnitType.Artillery: (4, 4),
-                UnitType.Engineer: (4, 6),
-                UnitType.AttackHelo: (12, 2)
-            }
-            self.base_attack, self.base_defense = default_values.get(self.unit_type, (8, 8))
-
-    def _calculate_equipment_attack(self, equipment):
-        """Calculate attack value from equipment stats."""
-        base_value = 0
-        if 'main_gun_mm' in equipment and equipment['main_gun_mm'] > 0:
-            base_value += equipment['main_gun_mm'] / 10
-        if 'has_atgm' in equipment and equipment['has_atgm']:
-            base_value += 3
+    @staticmethod
+    def build_template_stats(battalion_templates, equipment_catalog):
+        """
+        Aggregate every battalion template's equipment into combat values.
+        
+        Per-equipment values are computed column-wise over the catalog and
+        joined onto the template rows in one merge, so building all units
+        costs one pass over the data instead of a catalog scan per row.
+        
+        Returns:
+            dict: template_id -> (UnitType, (base_attack, base_defense)), where
+                the combat values are None if the template counts no equipment
+        """
+        stats = {}
+        if battalion_templates.empty:
+            return stats
+        
+        templates = battalion_templates.drop_duplicates('template_id')
+        for template_id, unit_type in zip(templates['template_id'], templates['unit_type']):
+            stats[template_id] = (UnitType(unit_type), None)
+        
+        if equipment_catalog.empty or 'quantity' not in battalion_templates:
+            return stats
+        
+        # Only the first catalog entry for an equipment id is used
+        equipment = equipment_catalog.drop_duplicates('equipment_id')
+        values = equipment[['equipment_id']].assign(
+            atk=Unit._equipment_attack_values(equipment),
+            def_=Unit._equipment_defense_values(equipment))
+        
+        rows = battalion_templates[['template_id', 'equipment_id', 'quantity']]
+        rows = rows[rows['equipment_id'].notna() & (rows['equipment_id'] != '') & 
+                    (rows['quantity'] > 0)]
+        merged = rows.merge(values, on='equipment_id')
+        
+        totals = merged.assign(
+            atk=merged['atk'] * merged['quantity'],
+            def_=merged['def_'] * merged['quantity']
+        ).groupby('template_id')[['atk', 'def_', 'quantity']].sum()
+        
+        for template_id, atk, def_, quantity in zip(
+                totals.index, totals['atk'], totals['def_'], totals['quantity']):
+            # Normalize by equipment count
+            stats[template_id] = (stats[template_id][0],
+                                  (int(atk / quantity), int(def_ / quantity)))
+        return stats
+
+    @staticmethod
+    def _equipment_attack_values(equipment):
+        """Calculate attack values for every row of an equipment frame."""
+        base_value = np.zeros(len(equipment))
+        if 'main_gun_mm' in equipment:
+            gun = equipment['main_gun_mm'].to_numpy(dtype=float)
+            base_value += np.where(gun > 0, gun / 10, 0)
+        if 'has_atgm' in equipment:
+            base_value += np.where(equipment['has_atgm'].to_numpy(dtype=bool), 3, 0)
         if 'engine_hp' in equipment:
-            base_value += equipment['engine_hp'] / 200
-        return min(20, max(1, int(base_value)))
+            base_value += equipment['engine_hp'].to_numpy(dtype=float) / 200
+        return np.clip(np.trunc(base_value), 1, 20).astype(int)
 
-    def _calculate_equipment_defense(self, equipment):
-        """Calculate defense value from equipment stats."""
-        base_value = 0
+    @staticmethod
+    def _equipment_defense_values(equipment):
+        """Calculate defense values for every row of an equipment frame."""
+        base_value = np.zeros(len(equipment))
         if 'armor_rating' in equipment:
-            base_value += equipment['armor_rating'] * 1.5
+            base_value += equipment['armor_rating'].to_numpy(dtype=float) * 1.5
         if 'weight_tonnes' in equipment:
-            base_value += equipment['weight_tonnes'] / 10
-        return min(20, max(1, int(base_value)))
+            base_value += equipment['weight_tonnes'].to_numpy(dtype=float) / 10
+        return np.clip(np.trunc(base_value), 1, 20).astype(int)
 
     def _set_movement_points(self):
         """Set movement points based on unit type."""
-        movement_by_type = {
-            UnitType.Armor: 6,
-            UnitType.Mechanized: 8,
-            UnitType.Infantry: 4,
-            UnitType.Artillery: 4,
-            UnitType.Engineer: 4,
-            UnitType.AttackHelo: 12
-        }
-        self.movement_points = movement_by_type.get(self.unit_type, 4)
-
-    def get_current_attack(self):
-        """Get current attack value adjusted for strength."""
-        return self.base_attack * (self.strength / 100)
-
-    def get_current_defense(self):
-        """Get current defense value adjusted for strength."""
-        return self.base_defense * (self.strength / 100)
+        self.movement_points = _MOVEMENT_POINTS.get(self.unit_type, 4)
 
     def take_damage(self, percentage):
         """Apply damage as a percentage of current strength."""
         damage = int(round(self.strength * (percentage / 100)))
-        self.strength -= damage
-        if self.strength < 0:
-            self.strength = 0
-        print(f"  - {self.unit_id} takes {percentage}% damage. New strength: {self.strength}")
+        remaining = self.strength - damage
+        self._set_strength(remaining if remaining > 0 else 0)
+        self._report_damage(percentage)
+
+    def eliminate(self):
+        """Reduce the unit to zero strength."""
+        self._set_strength(0)
+
+    def _set_strength(self, strength):
+        """Set strength, keeping the table row in step."""
+        self.strength = strength
+        if self._table is not None:
+            self._table.strength[self._row] = strength
+
+    def _report_damage(self, percentage):
+        """Log a damage event when combat logging is on."""
+        if VERBOSE_COMBAT:
+            print(f"  - {self.unit_id} takes {percentage}% damage. New strength: {self.strength}")
 
     def is_destroyed(self):
         """Check if unit is destroyed."""
@@ -235,6 +292,197 @@ class Unit:
         """Check if unit can attack this turn."""
         return not self.has_attacked and self.strength > 0
 
+    def reset_turn_flags(self):
+        """Clear the per-turn action flags at the start of a turn."""
+        self.has_moved = self.has_attacked = self.is_fortified = self.is_supporting_arty = False
+
     def __repr__(self):
-        return (f"Unit({self.unit_id}, {self.faction.value}, {self.unit_type.value}, "
-                f"Str: {self.strength}, Loc: {self.location_hex_id})")
\ No newline at end of file
+        return (f"Unit({self.unit_id}, {self.faction.name}, {self.unit_type.value}, "
+                f"Str: {self.strength}, Loc: {self.location_hex_id})")
+
+
+class UnitTable:
+    """
+    Struct-of-arrays registry of every unit that has entered play.
+    
+    Each unit gets one row for the rest of the game; rows are never reused,
+    so destroyed units keep their history. The Unit objects stay the
+    authoritative state: static fields are copied in when a unit is added,
+    and Unit.take_damage / Unit.eliminate mirror strength changes into the
+    unit's row.
+    
+    Attributes:
+        units (list): Unit object per row
+        row (dict): Unit ID -> row
+        faction (np.ndarray): Faction value per row (int8)
+        base_attack (np.ndarray): Base attack value per row (int32)
+        base_defense (np.ndarray): Base defense value per row (int32)
+        initial_strength (np.ndarray): Starting strength per row (int32)
+        strength (np.ndarray): Current strength per row (int16)
+        alive (np.ndarray): False once a unit has been removed from play
+    
+    Column arrays can be replaced when the table grows, so read them from
+    the table each time rather than holding on to them.
+    """
+    
+    def __init__(self, capacity=0):
+        """Initialize an empty table with room for capacity units."""
+        self.units = []
+        self.row = {}
+        self.faction = np.zeros(capacity, dtype=np.int8)
+        self.base_attack = np.zeros(capacity, dtype=np.int32)
+        self.base_defense = np.zeros(capacity, dtype=np.int32)
+        self.initial_strength = np.zeros(capacity, dtype=np.int32)
+        self.strength = np.zeros(capacity, dtype=np.int16)
+        self.alive = np.zeros(capacity, dtype=bool)
+    
+    def __len__(self):
+        return len(self.units)
+    
+    def _grow(self):
+        """Double the capacity of every column."""
+        grow = max(len(self.alive), 1)
+        for name in ('faction', 'base_attack', 'base_defense', 
+                     'initial_strength', 'strength', 'alive'):
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros(grow, column.dtype)]))
+    
+    def add(self, unit):
+        """
+        Give a unit a row and bind the unit to it.
+        
+        Returns:
+            int: The unit's row
+        """
+        row = len(self.units)
+        if row == len(self.alive):
+            self._grow()
+        
+        self.units.append(unit)
+        self.row[unit.unit_id] = row
+        self.faction[row] = unit.faction
+        self.base_attack[row] = unit.base_attack
+        self.base_defense[row] = unit.base_defense
+        self.initial_strength[row] = unit.initial_strength
+        self.strength[row] = unit.strength
+        self.alive[row] = True
+        unit._table = self
+        unit._row = row
+        return row
+    
+    def remove(self, unit):
+        """Mark a unit removed from play; its row is kept."""
+        self.alive[self.row[unit.unit_id]] = False
+    
+    def rows_of(self, units):
+        """Row indices of the given units, as an int array."""
+        return np.fromiter((unit._row for unit in units), dtype=np.intp)
+    
+    def take_damage(self, units, percentage):
+        """
+        Apply the same percentage loss to several units at once.
+        
+        Matches Unit.take_damage unit for unit (round-half-even, floor at
+        zero), with the arithmetic done on the strength column; each result
+        is stored through Unit._set_strength, which also writes the row.
+        """
+        strength = self.strength[self.rows_of(units)]
+        damage = np.rint(strength * (percentage / 100)).astype(strength.dtype)
+        np.subtract(strength, damage, out=strength)
+        np.maximum(strength, 0, out=strength)
+        for unit, value in zip(units, strength.tolist()):
+            unit._set_strength(value)
+            unit._report_damage(percentage)
+    
+    def destroyed_rows(self):
+        """Rows of units still in play whose strength has reached zero."""
+        n = len(self.units)
+        return np.flatnonzero(self.alive[:n] & (self.strength[:n] <= 0))
+    
+    def attack_power(self, rows):
+        """Summed current attack (base attack x strength / 100) of the given rows."""
+        return float((self.base_attack[rows] * (self.strength[rows] / 100.0)).sum())
+    
+    def defense_power(self, rows):
+        """Summed current defense (base defense x strength / 100) of the given rows."""
+        return float((self.base_defense[rows] * (self.strength[rows] / 100.0)).sum())
+
+
+class UnitView:
+    """
+    Columnar (one array per field) snapshot of the units in play for AI agents.
+    
+    Row i describes unit_ids[i]; rows follow engine unit order, which is also
+    UnitTable row order. The engine refills one view in place for each game
+    state it builds, so a view is only valid until the next game state is
+    built and agents must treat the arrays as read-only.
+    
+    Attributes:
+        unit_ids (list): Unit IDs, one per row
+        faction (np.ndarray): Faction value per unit (int8)
+        strength (np.ndarray): Current strength per unit (int16)
+        has_moved (np.ndarray): Whether each unit has moved this turn
+        has_attacked (np.ndarray): Whether each unit has attacked this turn
+        location_hex_idx (np.ndarray): Dense hex index of each unit's
+            location, or -1 if the unit is not on the map (int32)
+    """
+    
+    def __init__(self):
+        """Initialize an empty view; arrays are sized on first refresh."""
+        self.unit_ids = []
+        self._rows = np.empty(0, dtype=np.intp)
+        self._units = []
+        self._allocate(0)
+    
+    def _allocate(self, capacity):
+        """Allocate backing arrays able to hold capacity units."""
+        self._faction = np.zeros(capacity, dtype=np.int8)
+        self._strength = np.zeros(capacity, dtype=np.int16)
+        self._has_moved = np.zeros(capacity, dtype=bool)
+        self._has_attacked = np.zeros(capacity, dtype=bool)
+        self._location_hex_idx = np.full(capacity, -1, dtype=np.int32)
+    
+    def refresh(self, table, hex_index):
+        """
+        Refill the view from the engine's unit table.
+        
+        Faction and strength are gathered straight from the table columns;
+        per-turn flags and locations are read from the units. Backing arrays
+        are only reallocated when the units in play outgrow them (e.g. after
+        reinforcements land).
+        
+        Args:
+            table: UnitTable of every unit that has entered play
+            hex_index: Mapping of hex ID to dense hex index
+            
+        Returns:
+            self, for convenient chaining
+        """
+        rows = np.flatnonzero(table.alive[:len(table)])
+        n = len(rows)
+        if n > len(self._faction):
+            self._allocate(n)
+        
+        # Unit membership only changes on reinforcement or elimination
+        if not np.array_equal(rows, self._rows):
+            self._rows = rows
+            self._units = [table.units[row] for row in rows.tolist()]
+            self.unit_ids = [unit.unit_id for unit in self._units]
+        units = self._units
+        
+        np.take(table.faction, rows, out=self._faction[:n])
+        np.take(table.strength, rows, out=self._strength[:n])
+        self._has_moved[:n] = [unit.has_moved for unit in units]
+        self._has_attacked[:n] = [unit.has_attacked for unit in units]
+        self._location_hex_idx[:n] = [hex_index.get(unit.location_hex_id, -1) 
+                                      for unit in units]
+        
+        self.faction = self._faction[:n]
+        self.strength = self._strength[:n]
+        self.has_moved = self._has_moved[:n]
+        self.has_attacked = self._has_attacked[:n]
+        self.location_hex_idx = self._location_hex_idx[:n]
+        return self
+    
+    def __len__(self):
+        return len(self.unit_ids)